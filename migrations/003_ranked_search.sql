@@ -0,0 +1,80 @@
+-- Ranked full-text search with fuzzy title matching
+-- Replaces the ilike scan used by the Search Articles tool
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Stored search document, weighted title > excerpt > body.
+-- Generated columns are computed after BEFORE triggers, so auto-generated excerpts are included.
+ALTER TABLE news ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', COALESCE(news_title, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(news_excerpt, '')), 'B') ||
+        setweight(to_tsvector('english', COALESCE(newscontent, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_news_search_vector ON news USING GIN (search_vector);
+
+-- The expression index from 001 is superseded by the stored column
+DROP INDEX IF EXISTS idx_news_search;
+
+-- Trigram index for typo-tolerant title matching
+CREATE INDEX IF NOT EXISTS idx_news_title_trgm ON news USING GIN (news_title gin_trgm_ops);
+
+-- Ranked search returning summary rows with a highlighted snippet.
+-- Called through PostgREST as rpc('search_news') and directly by the Postgres backend.
+CREATE OR REPLACE FUNCTION search_news(
+    query TEXT,
+    status TEXT DEFAULT 'all',
+    max_results INTEGER DEFAULT 20,
+    result_offset INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+    id INTEGER,
+    news_title VARCHAR,
+    news_excerpt TEXT,
+    news_url VARCHAR,
+    news_image VARCHAR,
+    draft BOOLEAN,
+    news_date TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE,
+    news_updated TIMESTAMP WITH TIME ZONE,
+    rank REAL,
+    snippet TEXT,
+    total_count BIGINT
+)
+LANGUAGE sql STABLE
+AS $$
+    WITH q AS (
+        SELECT websearch_to_tsquery('english', query) AS tsq
+    ),
+    matches AS (
+        SELECT n.id,
+               ts_rank(n.search_vector, q.tsq) + word_similarity(query, n.news_title) AS score
+        FROM news n, q
+        WHERE (n.search_vector @@ q.tsq OR query <% n.news_title)
+          AND (status = 'all' OR n.draft = (status = 'draft'))
+    ),
+    page AS (
+        SELECT m.id, m.score, COUNT(*) OVER () AS total_count
+        FROM matches m
+        ORDER BY m.score DESC, m.id DESC
+        LIMIT max_results OFFSET result_offset
+    )
+    -- Snippets are only built for the returned page, never for every match
+    SELECT n.id, n.news_title, n.news_excerpt, n.news_url, n.news_image, n.draft,
+           n.news_date, n.created_at, n.news_updated, p.score::REAL AS rank,
+           ts_headline(
+               'english',
+               regexp_replace(n.newscontent, '<[^>]+>', ' ', 'g'),
+               q.tsq,
+               'StartSel=**, StopSel=**, MaxFragments=2, MinWords=10, MaxWords=30'
+           ) AS snippet,
+           p.total_count
+    FROM page p
+    JOIN news n ON n.id = p.id
+    CROSS JOIN q
+    ORDER BY p.score DESC, p.id DESC
+$$;
+
+COMMENT ON COLUMN news.search_vector IS 'Weighted full-text document (title A, excerpt B, content C)';
+COMMENT ON FUNCTION search_news IS 'Ranked full-text + fuzzy title search used by the Search Articles tool';
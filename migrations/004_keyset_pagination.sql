@@ -0,0 +1,10 @@
+-- Indexes for keyset pagination on (created_at, id)
+-- Lets "newest first" listings seek straight to the next page instead of scanning past an offset
+
+CREATE INDEX IF NOT EXISTS idx_news_created_at_id ON news (created_at DESC, id DESC);
+
+-- Covers the frequent "list drafts" / "list published" calls
+CREATE INDEX IF NOT EXISTS idx_news_draft_created_at_id ON news (draft, created_at DESC, id DESC);
+
+-- Superseded by the composite index above
+DROP INDEX IF EXISTS idx_news_created_at;
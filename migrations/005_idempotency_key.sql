@@ -0,0 +1,10 @@
+-- Idempotency key for articles created through Slack approvals
+-- A repeated or concurrent approval of the same pending action reuses the key, and
+-- INSERT ... ON CONFLICT (idempotency_key) DO NOTHING turns it into a no-op
+
+ALTER TABLE news ADD COLUMN IF NOT EXISTS idempotency_key TEXT;
+
+-- NULLs don't conflict, so articles created outside Slack are unaffected
+CREATE UNIQUE INDEX IF NOT EXISTS idx_news_idempotency_key ON news (idempotency_key);
+
+COMMENT ON COLUMN news.idempotency_key IS 'Key of the approved Slack action that created this article';
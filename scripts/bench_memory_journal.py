@@ -0,0 +1,125 @@
+"""Benchmark per-message write latency: whole-file JSON rewrite vs append-only journal.
+
+Pre-populates conversation memory with N threads, then times add_message() for both
+the old json.dump-everything approach and the JSONL journal used by ContextMemory:
+
+    python scripts/bench_memory_journal.py --threads 1000 10000 100000 --writes 200
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.journal import JsonlJournal
+
+MESSAGES_PER_THREAD = 4
+
+
+def seed_history(threads: int) -> dict:
+    """Synthetic history shaped like real Slack threads."""
+    return {
+        f"1700000000.{i:06d}": [
+            {
+                "role": "user" if j % 2 == 0 else "assistant",
+                "content": f"Message {j} about article {i}: please publish the spring gala recap.",
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+            for j in range(MESSAGES_PER_THREAD)
+        ]
+        for i in range(threads)
+    }
+
+
+def bench_rewrite(path: str, history: dict, writes: int) -> list[float]:
+    """The previous ContextMemory behaviour: rewrite the whole file per message."""
+    timings = []
+    for n in range(writes):
+        history[f"1700000000.{n:06d}"].append(
+            {"role": "user", "content": "new message", "timestamp": datetime.utcnow().isoformat()}
+        )
+        start = time.perf_counter()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(history, f, indent=2, ensure_ascii=False)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def bench_journal(path: str, history: dict, writes: int) -> tuple[list[float], float]:
+    """Append-only journal: one record per message. Also times startup replay."""
+    journal = JsonlJournal(path)
+    for thread_id, messages in history.items():
+        for msg in messages:
+            journal.append(
+                {"t": thread_id, "r": msg["role"], "c": msg["content"], "ts": msg["timestamp"]}
+            )
+
+    timings = []
+    for n in range(writes):
+        record = {
+            "t": f"1700000000.{n:06d}",
+            "r": "user",
+            "c": "new message",
+            "ts": datetime.utcnow().isoformat(),
+        }
+        start = time.perf_counter()
+        journal.append(record)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    replayed = sum(1 for _ in journal.replay())
+    replay_ms = (time.perf_counter() - start) * 1000
+    assert replayed == journal.record_count
+    journal.close()
+    return timings, replay_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument(
+        "--rewrite-writes", type=int, default=20, help="writes to time for the slow rewrite path"
+    )
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"Conversation memory write latency ({MESSAGES_PER_THREAD} messages per thread)")
+    print("=" * 78)
+    print(
+        f"{'threads':>9}{'rewrite p50':>14}{'rewrite p99':>14}"
+        f"{'append p50':>13}{'append p99':>13}{'replay ms':>12}"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for threads in args.threads:
+            rewrite = bench_rewrite(
+                os.path.join(tmp, "history.json"),
+                seed_history(threads),
+                min(args.rewrite_writes, threads),
+            )
+            append, replay_ms = bench_journal(
+                os.path.join(tmp, f"history-{threads}.jsonl"),
+                seed_history(threads),
+                min(args.writes, threads),
+            )
+            print(
+                f"{threads:>9}"
+                f"{statistics.median(rewrite):>12.2f}ms"
+                f"{statistics.quantiles(rewrite, n=100)[98]:>12.2f}ms"
+                f"{statistics.median(append):>11.3f}ms"
+                f"{statistics.quantiles(append, n=100)[98]:>11.3f}ms"
+                f"{replay_ms:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Benchmark ranked full-text search against the ilike scan on a synthetic news table.
+
+Needs a Postgres database (DATABASE_URL) with migrations/003_ranked_search.sql applied.
+The synthetic rows live in a throwaway `bench_search` schema that is dropped afterwards:
+
+    python scripts/bench_search.py --rows 100000 --repeat 5
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.settings import settings
+
+SCHEMA = "bench_search"
+
+VOCABULARY = (
+    "piano pianos concert choir opera harmony garden community school hospital artist "
+    "volunteer donor gala festival summer spring launch program music song voice healing "
+    "public art park plaza borough city youth teacher workshop residency performance stage "
+    "broadway orchestra jazz hope joy equity wellness mural design studio family neighborhood"
+).split()
+
+QUERIES = [
+    "piano",
+    "harmony garden",
+    '"summer festival" -gala',
+    "youth choir workshop",
+    "pianno launch",  # typo: only the trigram title match can find it
+]
+
+ILIKE_SQL = text(
+    """
+    SELECT id, news_title, news_excerpt, draft, created_at, COUNT(*) OVER () AS total_count
+    FROM news
+    WHERE news_title ILIKE :pattern OR newscontent ILIKE :pattern
+    ORDER BY created_at DESC
+    LIMIT 20
+    """
+)
+
+RANKED_SQL = text("SELECT * FROM search_news(:query, 'all', 20, 0)")
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    """Build a pseudo-sentence from the vocabulary."""
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words)).capitalize() + "."
+
+
+def populate(conn, rows: int, batch: int = 5000) -> None:
+    """Create the bench schema and fill it with synthetic articles."""
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    # INCLUDING ALL copies the generated search_vector column and every index
+    conn.execute(text(f"CREATE TABLE {SCHEMA}.news (LIKE public.news INCLUDING ALL)"))
+
+    rng = random.Random(42)
+    insert = text(
+        f"INSERT INTO {SCHEMA}.news (news_title, news_excerpt, newscontent, draft) "
+        "VALUES (:news_title, :news_excerpt, :newscontent, :draft)"
+    )
+    for start in range(0, rows, batch):
+        chunk = [
+            {
+                "news_title": sentence(rng, 6)[:-1].title(),
+                "news_excerpt": sentence(rng, 25),
+                "newscontent": "".join(f"<p>{sentence(rng, 30)}</p>" for _ in range(4)),
+                "draft": rng.random() < 0.3,
+            }
+            for _ in range(min(batch, rows - start))
+        ]
+        conn.execute(insert, chunk)
+        print(f"  inserted {start + len(chunk):>7}/{rows}", end="\r")
+    conn.execute(text(f"ANALYZE {SCHEMA}.news"))
+    print()
+
+
+def time_query(conn, statement, params: dict, repeat: int) -> tuple[float, int]:
+    """Median latency (ms) and total matches for a query."""
+    timings = []
+    total = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = conn.execute(statement, params).all()
+        timings.append((time.perf_counter() - start) * 1000)
+        total = rows[0].total_count if rows else 0
+    return statistics.median(timings), total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="keep the bench schema afterwards")
+    args = parser.parse_args()
+
+    engine = create_engine(settings.database_url)
+
+    print("=" * 78)
+    print(f"Search benchmark: {args.rows} synthetic articles, median of {args.repeat} runs")
+    print("=" * 78)
+
+    try:
+        with engine.begin() as conn:
+            populate(conn, args.rows)
+
+        with engine.connect() as conn:
+            # search_news() resolves `news` through the search path
+            conn.execute(text(f"SET search_path TO {SCHEMA}, public"))
+            header = f"{'query':<26}{'ilike ms':>10}{'hits':>8}{'ranked ms':>12}{'hits':>8}"
+            print(f"\n{header}{'speedup':>10}")
+            for query in QUERIES:
+                ilike_ms, ilike_hits = time_query(
+                    conn, ILIKE_SQL, {"pattern": f"%{query}%"}, args.repeat
+                )
+                ranked_ms, ranked_hits = time_query(conn, RANKED_SQL, {"query": query}, args.repeat)
+                print(
+                    f"{query:<26}{ilike_ms:>10.1f}{ilike_hits:>8}{ranked_ms:>12.1f}"
+                    f"{ranked_hits:>8}{ilike_ms / ranked_ms:>9.1f}x"
+                )
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,14 +9,14 @@ from sqlalchemy import text
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config.settings import settings
-from src.database.client import db_client
+from src.database.client import get_db_client
 from src.database.models import Base
 
 
 def create_tables() -> None:
     """Create all tables using SQLAlchemy models."""
     print("Creating tables using SQLAlchemy...")
-    Base.metadata.create_all(bind=db_client.engine)
+    Base.metadata.create_all(bind=get_db_client().engine)
     print("✅ Tables created successfully!")
 
 
@@ -27,7 +27,7 @@ def run_migration(migration_file: Path) -> None:
     with open(migration_file, "r", encoding="utf-8") as f:
         sql = f.read()
     
-    session = db_client.get_session()
+    session = get_db_client().get_session()
     try:
         # Split by semicolon and execute each statement
         statements = [s.strip() for s in sql.split(";") if s.strip()]
@@ -0,0 +1,138 @@
+"""Local OpenAI-compatible mock server for LLM benchmarks.
+
+Answers POST /v1/chat/completions with a canned article in the JSON format
+Generate Content expects, after a configurable delay (optionally per model). Supports
+"stream": true (server-sent events, one chunk per word). Keeps connections alive like the real API.
+
+    python scripts/mock_llm_server.py --port 8100 --latency-ms 300 --token-ms 15
+
+Benchmarks import `serve()` to run it in-process on a free port.
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ARTICLE = {
+    "title": "Harmony Garden Opens in the South Bronx",
+    "excerpt": "Sing for Hope and local artists unveil a garden of painted pianos.",
+    "content": (
+        "## A New Place to Play\n\n"
+        + "Neighbors gathered at 145th St & Willis Ave as three SFH Pianos, painted by "
+        "local students, opened to the public. " * 20
+    ),
+}
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so pooled clients can reuse the connection
+    latency = 0.3
+    token_delay = 0.0
+    model_latency: dict = {}  # model name -> latency, overriding `latency`
+    requests = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        type(self).requests += 1
+        model = body.get("model", "mock")
+        time.sleep(self.model_latency.get(model, self.latency))
+        text = json.dumps(ARTICLE)
+        if body.get("stream"):
+            self._stream(model, text)
+            return
+
+        payload = json.dumps({
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 200, "completion_tokens": 400, "total_tokens": 600},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _stream(self, model: str, text: str):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def send(data: str):
+            chunk = f"data: {data}\n\n".encode()
+            self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.flush()
+
+        words = text.split(" ")
+        for i, word in enumerate(words):
+            delta = word if i == len(words) - 1 else word + " "
+            send(json.dumps({
+                "id": "chatcmpl-mock",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": delta}, "finish_reason": None}],
+            }))
+            time.sleep(self.token_delay)
+        send(json.dumps({
+            "id": "chatcmpl-mock",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+        }))
+        send("[DONE]")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(
+    port: int = 0,
+    latency: float = 0.3,
+    token_delay: float = 0.0,
+    model_latency: dict | None = None,
+) -> ThreadingHTTPServer:
+    """Start the mock on a background thread; the base URL is `base_url(server)`."""
+    handler = type("Handler", (MockLLMHandler,), {
+        "latency": latency,
+        "token_delay": token_delay,
+        "model_latency": dict(model_latency or {}),
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def base_url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address
+    return f"http://{host}:{port}/v1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=300)
+    parser.add_argument("--token-ms", type=float, default=15)
+    args = parser.parse_args()
+
+    server = serve(args.port, args.latency_ms / 1000, args.token_ms / 1000)
+    print(f"Mock LLM listening on {base_url(server)} (LLM_BASE_URL)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 """Agents package."""
 
-from src.agents.newsletter_manager import create_newsletter_manager_agent, newsletter_agent
+from src.agents.newsletter_manager import (
+    create_newsletter_manager_agent,
+    get_newsletter_agent,
+    newsletter_agent,
+)
 
-__all__ = ["create_newsletter_manager_agent", "newsletter_agent"]
+__all__ = ["create_newsletter_manager_agent", "get_newsletter_agent", "newsletter_agent"]
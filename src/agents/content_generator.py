@@ -1,7 +1,9 @@
 """Content Generator Agent - Specialized agent for generating article content."""
 
+import threading
+
 from crewai import Agent
-from src.config.llm import get_llm
+from src.config.llm import get_llm, model_router
 from src.tools.content import generate_content
 
 
@@ -37,7 +39,7 @@ Remember: You are a TOOL EXECUTOR. Execute the Generate Content tool immediately
         goal="Generate article content using the Generate Content tool",
         backstory=backstory,
         tools=[generate_content],  # ONLY this tool
-        llm=get_llm(),
+        llm=get_llm(model_router.tier("agent", "content_generator")),
         verbose=True,
         allow_delegation=False,
         max_iter=3,  # Should finish in 1-2 iterations
@@ -46,5 +48,16 @@ Remember: You are a TOOL EXECUTOR. Execute the Generate Content tool immediately
     return agent
 
 
-# Global instance
-content_generator_agent = create_content_generator_agent()
+_local = threading.local()
+
+
+def get_content_generator_agent() -> Agent:
+    """This thread's Content Generator agent (agents are not safe to share across threads)."""
+    agent = getattr(_local, "agent", None)
+    if agent is None:
+        agent = _local.agent = create_content_generator_agent()
+    return agent
+
+
+# Global instance (single-threaded scripts; the bot uses get_content_generator_agent)
+content_generator_agent = get_content_generator_agent()
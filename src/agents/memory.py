@@ -1,91 +1,458 @@
 """
 Context Memory Manager for Slack Bot.
 Stores conversation history to allow multi-turn interactions.
-Currently uses a simple JSON file for persistence.
+Persists to an append-only JSONL journal: each message appends one line, and the
+journal is compacted in the background once trimmed messages dominate it.
+
+Only recently active threads are held in RAM (an LRU cache with an idle TTL). For
+the rest, memory keeps just the journal offsets of their last messages and reads
+them back on demand. Threads idle longer than MEMORY_RETENTION_DAYS are forgotten
+(and dropped from the journal at the next compaction), so both stay bounded.
+
+The journal is private to one process. With STATE_BACKEND=sqlite or redis, history
+is kept in that shared store instead and read through on every call, so several bot
+processes see the same conversations.
 """
 
 import json
 import logging
 import os
-from datetime import datetime
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import Dict, List, Any
 
+from src.agents.state_backends import connect_sqlite
+from src.config.settings import settings
+from src.utils.journal import JsonlJournal, Relocate
+
 # File to store history
-HISTORY_FILE = "conversation_history.json"
-MAX_HISTORY_PER_THREAD = 10
+HISTORY_FILE = "conversation_history.jsonl"
+LEGACY_HISTORY_FILE = "conversation_history.json"
+MAX_HISTORY_PER_THREAD = settings.memory_history_per_thread
+RETENTION_SECONDS = settings.memory_retention_days * 86400
 
 logger = logging.getLogger(__name__)
 
-class ContextMemory:
-    def __init__(self, file_path: str = HISTORY_FILE):
-        self.file_path = file_path
-        self.history: Dict[str, List[Dict[str, Any]]] = {}
-        self._load_memory()
-
-    def _load_memory(self):
-        """Load history from file."""
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.history = data
-            except Exception as e:
-                logger.error(f"Failed to load memory: {e}")
-                self.history = {}
-
-    def _save_memory(self):
-        """Save history to file."""
-        try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.history, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Failed to save memory: {e}")
+class ConversationMemory(ABC):
+    """Per-thread conversation history, capped at MAX_HISTORY_PER_THREAD messages."""
 
+    @abstractmethod
     def add_message(self, thread_id: str, role: str, content: str):
         """
         Add a message to the thread history.
         role: 'user' or 'assistant'
         """
-        if thread_id not in self.history:
-            self.history[thread_id] = []
-        
-        # Add message
-        self.history[thread_id].append({
-            "role": role,
-            "content": content,
-            "timestamp": datetime.utcnow().isoformat()
-        })
-        
-        # Trim history
-        if len(self.history[thread_id]) > MAX_HISTORY_PER_THREAD:
-            self.history[thread_id] = self.history[thread_id][-MAX_HISTORY_PER_THREAD:]
-            
-        self._save_memory()
 
+    @abstractmethod
     def get_history(self, thread_id: str) -> List[Dict[str, Any]]:
         """Get history for a thread."""
-        return self.history.get(thread_id, [])
+
+    @abstractmethod
+    def clear_history(self, thread_id: str):
+        """Clear history for a thread."""
 
     def get_formatted_history(self, thread_id: str) -> str:
         """Get history formatted as a string for LLM context."""
         history = self.get_history(thread_id)
         if not history:
             return ""
-            
+
         formatted = "PREVIOUS CONVERSATION HISTORY:\n"
         for msg in history:
             role = "User" if msg["role"] == "user" else "Assistant"
             formatted += f"{role}: {msg['content']}\n"
-        
+
         formatted += "\n(Use this history to understand context, referrals to 'it' or 'that', and previous actions)\n"
         return formatted
 
+    @staticmethod
+    def _message(role: str, content: str) -> Dict[str, Any]:
+        return {
+            "role": role,
+            "content": content,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+
+class ContextMemory(ConversationMemory):
+    """Single-process history: hot LRU cache over an append-only journal."""
+
+    def __init__(
+        self,
+        file_path: str = HISTORY_FILE,
+        max_threads: int = settings.memory_max_threads,
+        thread_ttl: float = settings.memory_thread_ttl,
+        retention: float = RETENTION_SECONDS,
+    ):
+        self.file_path = file_path
+        self.max_threads = max_threads
+        self.thread_ttl = thread_ttl
+        self.retention = retention
+        # Hot cache: thread_id -> (messages, last access), least recently used first
+        self._cache: OrderedDict[str, tuple[List[Dict[str, Any]], float]] = OrderedDict()
+        # Every known thread -> journal offsets of its kept messages, oldest first
+        self._index: Dict[str, List[int]] = {}
+        # Every known thread -> time of its last message (epoch), least recent first
+        self._active: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.RLock()
+        self._live = 0  # messages currently kept, i.e. records a compaction would keep
+        self.hits = 0
+        self.misses = 0
+        self._load_memory()
+
+    def _load_memory(self):
+        """Rebuild the offset index by replaying the journal."""
+        legacy = self._load_legacy()
+        self.journal = JsonlJournal(self.file_path, lock=self._lock)
+
+        if legacy is not None:
+            for thread_id, messages in legacy.items():
+                for msg in messages:
+                    self._record(thread_id, msg)
+            logger.info(f"Migrated {len(legacy)} threads from {LEGACY_HISTORY_FILE}")
+            self._prune()
+            return
+
+        try:
+            for offset, record in self.journal.replay():
+                thread_id = record["t"]
+                if record.get("op") == "clear":
+                    self._index.pop(thread_id, None)
+                    self._active.pop(thread_id, None)
+                else:
+                    self._keep(self._index.setdefault(thread_id, []), offset)
+                    self._seen(thread_id, record["ts"])
+        except Exception as e:
+            logger.error(f"Failed to load memory: {e}")
+        self._live = sum(len(offsets) for offsets in self._index.values())
+        self._prune()
+
+    def _load_legacy(self) -> Dict[str, List[Dict[str, Any]]] | None:
+        """Read the old whole-file JSON history if it hasn't been migrated yet."""
+        legacy_path = os.path.join(os.path.dirname(self.file_path), LEGACY_HISTORY_FILE)
+        if not os.path.exists(legacy_path) or os.path.exists(self.file_path):
+            return None
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {
+                thread_id: messages[-MAX_HISTORY_PER_THREAD:]
+                for thread_id, messages in data.items()
+            }
+        except Exception as e:
+            logger.error(f"Failed to load legacy memory: {e}")
+            return None
+
+    @staticmethod
+    def _keep(items: list, item) -> int:
+        """Append to a per-thread list, trimming it to the history limit. Returns the growth."""
+        items.append(item)
+        if len(items) > MAX_HISTORY_PER_THREAD:
+            del items[:-MAX_HISTORY_PER_THREAD]
+            return 0
+        return 1
+
+    def _record(self, thread_id: str, msg: Dict[str, Any]):
+        """Journal a message and index it. Caller holds the lock."""
+        record = {"t": thread_id, "r": msg["role"], "c": msg["content"], "ts": msg["timestamp"]}
+        offset = self.journal.append(record)
+        self._live += self._keep(self._index.setdefault(thread_id, []), offset)
+        self._seen(thread_id, msg["timestamp"])
+
+    def _seen(self, thread_id: str, timestamp: str):
+        """Mark a thread active as of a message's (naive UTC) ISO timestamp."""
+        try:
+            when = datetime.fromisoformat(timestamp).replace(tzinfo=timezone.utc).timestamp()
+        except (TypeError, ValueError):
+            when = time.time()
+        self._active[thread_id] = when
+        self._active.move_to_end(thread_id)
+
+    def _prune(self):
+        """Forget threads idle past the retention window. Caller holds the lock.
+
+        Their journal records are no longer indexed, so the next compaction drops them.
+        """
+        if self.retention <= 0:
+            return
+        cutoff = time.time() - self.retention
+        # Least recently active first, so stop at the first thread that is still kept
+        while self._active:
+            thread_id, last_active = next(iter(self._active.items()))
+            if last_active >= cutoff:
+                break
+            del self._active[thread_id]
+            self._live -= len(self._index.pop(thread_id, []))
+            self._cache.pop(thread_id, None)
+
+    def _touch(self, thread_id: str, messages: List[Dict[str, Any]]):
+        """Put a thread at the hot end of the cache and evict what no longer fits."""
+        now = time.monotonic()
+        self._cache[thread_id] = (messages, now)
+        self._cache.move_to_end(thread_id)
+
+        while len(self._cache) > self.max_threads:
+            self._cache.popitem(last=False)
+        # Oldest first, so stop at the first thread that is still fresh
+        while self._cache:
+            _, last_access = next(iter(self._cache.values()))
+            if now - last_access <= self.thread_ttl:
+                break
+            self._cache.popitem(last=False)
+
+    def _messages(self, thread_id: str) -> List[Dict[str, Any]] | None:
+        """Cached messages for a thread, loading a cold thread from the journal."""
+        cached = self._cache.get(thread_id)
+        if cached is not None and time.monotonic() - cached[1] <= self.thread_ttl:
+            self.hits += 1
+            return cached[0]
+
+        offsets = self._index.get(thread_id)
+        if not offsets:
+            return None
+        self.misses += 1
+        messages = [
+            {"role": record["r"], "content": record["c"], "timestamp": record["ts"]}
+            for record in self.journal.read(offsets)
+        ]
+        self._touch(thread_id, messages)
+        return messages
+
+    def _maybe_compact(self):
+        """Compact in the background once trimmed messages dominate the journal."""
+        with self._lock:
+            if not self.journal.needs_compaction(self._live):
+                return
+            # Offsets and position are taken together so no append is lost
+            offsets = [offset for kept in self._index.values() for offset in kept]
+            position = self.journal.position()
+        self.journal.compact_async(offsets, position, self._relocate)
+
+    def _relocate(self, relocate: Relocate):
+        """Point the index at the compacted journal. Runs under the lock."""
+        for thread_id, offsets in self._index.items():
+            self._index[thread_id] = [relocate(offset) for offset in offsets]
+
+    def add_message(self, thread_id: str, role: str, content: str):
+        msg = self._message(role, content)
+        with self._lock:
+            try:
+                self._record(thread_id, msg)
+            except Exception as e:
+                logger.error(f"Failed to save memory: {e}")
+
+            cached = self._cache.get(thread_id)
+            if cached is not None:
+                self._keep(cached[0], msg)
+                self._touch(thread_id, cached[0])
+            self._prune()
+
+        self._maybe_compact()
+
+    def get_history(self, thread_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            try:
+                messages = self._messages(thread_id)
+            except Exception as e:
+                logger.error(f"Failed to load history for {thread_id}: {e}")
+                return []
+            if messages is None:
+                return []
+            self._touch(thread_id, messages)
+            return list(messages)
+
     def clear_history(self, thread_id: str):
-        """Clear history for a thread."""
-        if thread_id in self.history:
-            del self.history[thread_id]
-            self._save_memory()
+        with self._lock:
+            if thread_id not in self._index:
+                return
+            self._live -= len(self._index.pop(thread_id))
+            self._active.pop(thread_id, None)
+            self._cache.pop(thread_id, None)
+            try:
+                self.journal.append({"t": thread_id, "op": "clear"})
+            except Exception as e:
+                logger.error(f"Failed to save memory: {e}")
+
+        self._maybe_compact()
+
+    def stats(self) -> Dict[str, int]:
+        """Cache occupancy and hit counts, for monitoring."""
+        with self._lock:
+            return {
+                "threads": len(self._index),
+                "hot_threads": len(self._cache),
+                "messages": self._live,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class SQLiteContextMemory(ConversationMemory):
+    """History in a SQLite (WAL) table shared by every process on the host.
+
+    Threads idle past the retention window are deleted, at most once per
+    `prune_interval` seconds per process.
+    """
+
+    def __init__(
+        self,
+        path: str = "agent_state.db",
+        retention: float = RETENTION_SECONDS,
+        prune_interval: float = 3600,
+    ):
+        self.path = path
+        self.retention = retention
+        self.prune_interval = prune_interval
+        self._next_prune = 0.0
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                thread_id TEXT NOT NULL,
+                role TEXT NOT NULL,
+                content TEXT NOT NULL,
+                timestamp TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_thread ON messages (thread_id, id)")
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = connect_sqlite(self.path)
+        return conn
+
+    def add_message(self, thread_id: str, role: str, content: str):
+        msg = self._message(role, content)
+        conn = self._conn()
+        try:
+            # Insert and trim in one write transaction so concurrent writers never
+            # observe (or leave behind) an over-long thread
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT INTO messages (thread_id, role, content, timestamp) VALUES (?, ?, ?, ?)",
+                (thread_id, msg["role"], msg["content"], msg["timestamp"]),
+            )
+            conn.execute(
+                "DELETE FROM messages WHERE thread_id = ? AND id NOT IN "
+                "(SELECT id FROM messages WHERE thread_id = ? ORDER BY id DESC LIMIT ?)",
+                (thread_id, thread_id, MAX_HISTORY_PER_THREAD),
+            )
+            conn.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.error(f"Failed to save memory: {e}")
+        self._maybe_prune()
+
+    def _maybe_prune(self):
+        """Delete threads whose latest message is older than the retention window."""
+        now = time.monotonic()
+        if self.retention <= 0 or now < self._next_prune:
+            return
+        self._next_prune = now + self.prune_interval
+        # Timestamps are naive UTC ISO strings, which sort chronologically
+        cutoff = datetime.utcfromtimestamp(time.time() - self.retention).isoformat()
+        try:
+            deleted = self._conn().execute(
+                "DELETE FROM messages WHERE thread_id IN "
+                "(SELECT thread_id FROM messages GROUP BY thread_id HAVING MAX(timestamp) < ?)",
+                (cutoff,),
+            ).rowcount
+            if deleted:
+                logger.info(f"Pruned {deleted} messages from idle threads")
+        except Exception as e:
+            logger.error(f"Failed to prune memory: {e}")
+
+    def get_history(self, thread_id: str) -> List[Dict[str, Any]]:
+        try:
+            rows = self._conn().execute(
+                "SELECT role, content, timestamp FROM messages WHERE thread_id = ? ORDER BY id",
+                (thread_id,),
+            ).fetchall()
+        except Exception as e:
+            logger.error(f"Failed to load history for {thread_id}: {e}")
+            return []
+        return [{"role": role, "content": content, "timestamp": ts} for role, content, ts in rows]
+
+    def clear_history(self, thread_id: str):
+        try:
+            self._conn().execute("DELETE FROM messages WHERE thread_id = ?", (thread_id,))
+        except Exception as e:
+            logger.error(f"Failed to save memory: {e}")
+
+
+class RedisContextMemory(ConversationMemory):
+    """History as one Redis list per thread, shared by every process that can reach Redis.
+
+    Each list expires once its thread has been idle for the retention window.
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        client: Any = None,
+        prefix: str = "sfh",
+        retention: float = RETENTION_SECONDS,
+    ):
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(url or settings.redis_url)
+        self.client = client
+        self.prefix = prefix
+        self.retention = retention
+
+    def _key(self, thread_id: str) -> str:
+        return f"{self.prefix}:memory:{thread_id}"
+
+    def add_message(self, thread_id: str, role: str, content: str):
+        key = self._key(thread_id)
+        try:
+            # MULTI/EXEC: the push and the trim are applied together
+            pipe = self.client.pipeline(transaction=True)
+            pipe.rpush(key, json.dumps(self._message(role, content)))
+            pipe.ltrim(key, -MAX_HISTORY_PER_THREAD, -1)
+            if self.retention > 0:
+                pipe.expire(key, int(self.retention))
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to save memory: {e}")
+
+    def get_history(self, thread_id: str) -> List[Dict[str, Any]]:
+        try:
+            return [json.loads(raw) for raw in self.client.lrange(self._key(thread_id), 0, -1)]
+        except Exception as e:
+            logger.error(f"Failed to load history for {thread_id}: {e}")
+            return []
+
+    def clear_history(self, thread_id: str):
+        try:
+            self.client.delete(self._key(thread_id))
+        except Exception as e:
+            logger.error(f"Failed to save memory: {e}")
+
+
+MEMORY_BACKENDS = {
+    "file": lambda: ContextMemory(),
+    "sqlite": lambda: SQLiteContextMemory(settings.state_db),
+    "redis": lambda: RedisContextMemory(settings.redis_url),
+}
+
+
+def create_memory() -> ConversationMemory:
+    """Build the conversation memory for `settings.state_backend`."""
+    name = settings.state_backend.lower()
+    if name not in MEMORY_BACKENDS:
+        raise ValueError(f"Unsupported state backend: {settings.state_backend}")
+    return MEMORY_BACKENDS[name]()
 
 
 # Global memory instance
-memory = ContextMemory()
+memory = create_memory()
@@ -1,17 +1,23 @@
 """Newsletter Manager Agent - Main CrewAI agent."""
 
+import threading
+from typing import Dict, Optional
+
 from crewai import Agent
 
-from src.config.llm import get_llm
+from src.config.llm import get_llm, model_router
 from src.tools import ALL_TOOLS
 
 
-def create_newsletter_manager_agent() -> Agent:
+def create_newsletter_manager_agent(tier: Optional[str] = None) -> Agent:
     """
     Create the Newsletter Manager AI agent.
     
     Based on specification in docs/agents-spec/newsletter_manager.md
     and behavioral guidelines in docs/blueprint/BEHAVIORAL_GUIDELINES.md
+    
+    Args:
+        tier: Model tier for the agent's turns (default: the router's tier for this agent)
     """
     
     # Load behavioral prompt
@@ -58,6 +64,15 @@ calm, supportive, and always confirm destructive actions before proceeding.
   - Instead, use `Generate Content` AGAIN with the original topic + the new specific details/requirements.
   - Or simply rewrite the content yourself if it's a small change.
   - **Goal**: Return the *revised* full content immediately.
+- "Regenerate", "try again", "give me another version" → call `Generate Content` with the same
+  arguments and `regenerate=True` (otherwise an identical request returns the earlier draft).
+
+## Handling Bulk Operations
+- For "publish all drafts", "delete all articles about X" and similar:
+  1. Use `Search Articles` to find the exact set of articles.
+  2. Call `Ask Confirmation` ONCE with the matching bulk tool (`Bulk Publish`, `Bulk Unpublish`,
+     `Bulk Delete` or `Bulk Update`), all `article_ids`, and a summary listing every title.
+  3. Never loop over single-article tools for a bulk request.
 
 ## Handling Ambiguity & Intent
 1. **Empty/Vague Requests**: If user says "help", "article", or just hi:
@@ -97,7 +112,7 @@ calm, supportive, and always confirm destructive actions before proceeding.
         goal="Help staff efficiently manage newsletter articles with clarity and safety",
         backstory=behavioral_prompt,
         tools=ALL_TOOLS,
-        llm=get_llm(),
+        llm=get_llm(tier or model_router.tier("agent", "newsletter_manager")),
         verbose=True,
         allow_delegation=False,
         max_iter=15,
@@ -106,5 +121,21 @@ calm, supportive, and always confirm destructive actions before proceeding.
     return agent
 
 
-# Global agent instance
-newsletter_agent = create_newsletter_manager_agent()
+# Agent.execute_task keeps per-task state (executor, messages) on the agent, so
+# concurrent jobs must not share one: each worker thread gets its own per tier
+_local = threading.local()
+
+
+def get_newsletter_agent(tier: Optional[str] = None) -> Agent:
+    """This thread's Newsletter Manager agent for a model tier, created on first use."""
+    tier = tier or model_router.tier("agent", "newsletter_manager")
+    agents: Dict[str, Agent] | None = getattr(_local, "agents", None)
+    if agents is None:
+        agents = _local.agents = {}
+    if tier not in agents:
+        agents[tier] = create_newsletter_manager_agent(tier)
+    return agents[tier]
+
+
+# Global agent instance (single-threaded scripts; the bot uses get_newsletter_agent)
+newsletter_agent = get_newsletter_agent()
@@ -1,74 +1,106 @@
-import json
 import logging
-import os
 from typing import Any, Dict, Optional
 from datetime import datetime
 
+from src.config.settings import settings
+from src.agents.state_backends import StateBackend, get_state_backend
+
 # Configure logging
 logger = logging.getLogger("StateManager")
 
+PENDING_ACTIONS = "pending_actions"
+APPROVAL_CLAIMS = "approval_claims"
+SLACK_EVENTS = "slack_events"
+
 class StateManager:
     """
     Manages persistent state for the agent, specifically 'Pending Actions'.
-    Using a JSON file ensures state survives bot restarts.
+    Entries live in a pluggable backend (see `settings.state_backend`) so state survives
+    bot restarts, and expire after `settings.confirmation_timeout` seconds.
     """
-    
-    def __init__(self, storage_file: str = "pending_actions.json"):
-        self.storage_file = storage_file
-        self._state: Dict[str, Any] = {}
-        self._load_state()
 
-    def _load_state(self):
-        """Load state from JSON file."""
-        if os.path.exists(self.storage_file):
-            try:
-                with open(self.storage_file, 'r', encoding='utf-8') as f:
-                    self._state = json.load(f)
-            except json.JSONDecodeError:
-                logger.error(f"Corrupt state file {self.storage_file}. Starting fresh.")
-                self._state = {}
-            except Exception as e:
-                logger.error(f"Error loading state: {e}")
-                self._state = {}
-        else:
-            self._state = {}
-
-    def _save_state(self):
-        """Save state to JSON file."""
-        try:
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump(self._state, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving state: {e}")
+    def __init__(self, backend: StateBackend | None = None, ttl: float | None = None):
+        self.backend = backend or get_state_backend()
+        self.ttl = ttl if ttl is not None else settings.confirmation_timeout
 
     def set_pending_action(self, thread_ts: str, action_data: Dict[str, Any]):
         """
         Store a pending action for a specific thread.
-        
+
         Args:
             thread_ts: The Slack thread timestamp (unique conversation ID).
             action_data: Dictionary containing tool_name, tool_args, summary, etc.
         """
-        self._state[thread_ts] = {
+        entry = {
             "data": action_data,
             "timestamp": datetime.now().isoformat()
         }
-        self._save_state()
-        logger.info(f"Pending action saved for thread {thread_ts}")
+        try:
+            self.backend.set(PENDING_ACTIONS, thread_ts, entry, ttl=self.ttl)
+            logger.info(f"Pending action saved for thread {thread_ts}")
+        except Exception as e:
+            logger.error(f"Error saving state: {e}")
 
     def get_pending_action(self, thread_ts: str) -> Optional[Dict[str, Any]]:
-        """Retrieve the pending action for a thread, if any."""
-        entry = self._state.get(thread_ts)
+        """Retrieve the pending action for a thread, if any and not expired."""
+        try:
+            entry = self.backend.get(PENDING_ACTIONS, thread_ts)
+        except Exception as e:
+            logger.error(f"Error loading state: {e}")
+            return None
         if entry:
             return entry.get("data")
         return None
 
     def clear_pending_action(self, thread_ts: str):
         """Remove the pending action for a thread (after execution or denial)."""
-        if thread_ts in self._state:
-            del self._state[thread_ts]
-            self._save_state()
-            logger.info(f"Pending action cleared for thread {thread_ts}")
+        try:
+            if self.backend.delete(PENDING_ACTIONS, thread_ts):
+                logger.info(f"Pending action cleared for thread {thread_ts}")
+        except Exception as e:
+            logger.error(f"Error saving state: {e}")
+
+    def claim_pending_action(self, thread_ts: str, owner: str) -> bool:
+        """
+        Take the lease on executing a thread's pending action.
+
+        Only one caller (across processes, with a shared backend) gets True until the
+        lease is released or expires after `settings.approval_lease_seconds`. The lease
+        is kept shorter than the pending action's TTL, so an approval that crashed
+        mid-way can be retried while the action still exists.
+        """
+        try:
+            return self.backend.add(
+                APPROVAL_CLAIMS,
+                thread_ts,
+                {"owner": owner, "timestamp": datetime.now().isoformat()},
+                ttl=min(settings.approval_lease_seconds, self.ttl / 2),
+            )
+        except Exception as e:
+            logger.error(f"Error claiming pending action: {e}")
+            return False
+
+    def release_claim(self, thread_ts: str):
+        """Give up the execution lease so the action can be approved again."""
+        try:
+            self.backend.delete(APPROVAL_CLAIMS, thread_ts)
+        except Exception as e:
+            logger.error(f"Error releasing claim: {e}")
+
+    def claim_event(self, event_id: str, ts: Optional[str] = None) -> bool:
+        """
+        Record a Slack event as accepted; False if it was already claimed.
+
+        Claims expire after `settings.event_dedup_ttl` seconds. If the backend fails
+        the event counts as claimed: a duplicate run is better than a dropped request.
+        """
+        try:
+            return self.backend.add(
+                SLACK_EVENTS, event_id, {"ts": ts}, ttl=settings.event_dedup_ttl
+            )
+        except Exception as e:
+            logger.error(f"Event dedup check failed, processing anyway: {e}")
+            return True
 
 # Global instance
 state_manager = StateManager()
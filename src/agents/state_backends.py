@@ -0,0 +1,324 @@
+"""Storage backends for short-lived agent state (pending actions and the like)."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+from src.config.settings import settings
+from src.utils.journal import JsonlJournal, Relocate
+
+logger = logging.getLogger("StateBackend")
+
+
+def connect_sqlite(path: str) -> sqlite3.Connection:
+    """Open an autocommit connection in WAL mode, safe to share the file across processes."""
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class StateBackend(ABC):
+    """Namespaced key/value store with optional per-entry TTL.
+
+    Values must be JSON-serialisable. Expired entries are never returned; `sweep()`
+    reclaims their storage and is run periodically by `start_sweeper()`.
+    """
+
+    _sweeper: threading.Thread | None = None
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return the value for `key`, or None if it is missing or expired."""
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value: Any, ttl: float | None = None):
+        """Store `value` under `key`, expiring after `ttl` seconds if given."""
+
+    @abstractmethod
+    def add(self, namespace: str, key: str, value: Any, ttl: float | None = None) -> bool:
+        """Store `value` only if `key` is missing or expired. Returns True if stored.
+
+        Atomic, so concurrent callers (even in other processes, for shared backends)
+        can use it to claim a key exactly once.
+        """
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> bool:
+        """Remove `key`. Returns True if it existed."""
+
+    def sweep(self) -> int:
+        """Drop expired entries and return how many were removed."""
+        return 0
+
+    def close(self):
+        """Release files or connections held by the backend."""
+
+    def start_sweeper(self, interval: float):
+        """Run `sweep()` every `interval` seconds on a daemon thread."""
+        if self._sweeper is not None:
+            return
+
+        def run():
+            while True:
+                time.sleep(interval)
+                try:
+                    removed = self.sweep()
+                    if removed:
+                        logger.info(f"Swept {removed} expired state entries")
+                except Exception as e:
+                    logger.error(f"State sweep failed: {e}")
+
+        self._sweeper = threading.Thread(target=run, name="state-sweeper", daemon=True)
+        self._sweeper.start()
+
+    @staticmethod
+    def _expires_at(ttl: float | None) -> float | None:
+        return time.time() + ttl if ttl else None
+
+
+class FileStateBackend(StateBackend):
+    """Single-process store: an in-memory dict persisted to an append-only journal.
+
+    Each set/delete appends one record; expired and overwritten records are dropped
+    when the journal is compacted.
+    """
+
+    def __init__(self, path: str = "agent_state.jsonl"):
+        self._lock = threading.RLock()
+        # (namespace, key) -> (value, expires_at, journal offset)
+        self._entries: Dict[Tuple[str, str], Tuple[Any, float | None, int]] = {}
+        self.journal = JsonlJournal(path, lock=self._lock)
+
+        now = time.time()
+        for offset, record in self.journal.replay():
+            entry_key = (record["n"], record["k"])
+            expires_at = record.get("e")
+            if record.get("op") == "del" or (expires_at and expires_at <= now):
+                self._entries.pop(entry_key, None)
+            else:
+                self._entries[entry_key] = (record["v"], expires_at, offset)
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return None
+            value, expires_at, _ = entry
+            if expires_at and expires_at <= time.time():
+                del self._entries[(namespace, key)]
+                return None
+            return value
+
+    def set(self, namespace: str, key: str, value: Any, ttl: float | None = None):
+        expires_at = self._expires_at(ttl)
+        with self._lock:
+            offset = self.journal.append({"n": namespace, "k": key, "v": value, "e": expires_at})
+            self._entries[(namespace, key)] = (value, expires_at, offset)
+        self._maybe_compact()
+
+    def add(self, namespace: str, key: str, value: Any, ttl: float | None = None) -> bool:
+        with self._lock:
+            if self.get(namespace, key) is not None:
+                return False
+            self.set(namespace, key, value, ttl)
+            return True
+
+    def delete(self, namespace: str, key: str) -> bool:
+        with self._lock:
+            if self._entries.pop((namespace, key), None) is None:
+                return False
+            self.journal.append({"n": namespace, "k": key, "op": "del"})
+        self._maybe_compact()
+        return True
+
+    def sweep(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [
+                entry_key
+                for entry_key, (_, expires_at, _) in self._entries.items()
+                if expires_at and expires_at <= now
+            ]
+            # No journal write needed: replay skips expired records too
+            for entry_key in expired:
+                del self._entries[entry_key]
+        self._maybe_compact()
+        return len(expired)
+
+    def _maybe_compact(self):
+        with self._lock:
+            if not self.journal.needs_compaction(len(self._entries)):
+                return
+            offsets = [offset for _, _, offset in self._entries.values()]
+            position = self.journal.position()
+        self.journal.compact_async(offsets, position, self._relocate)
+
+    def _relocate(self, relocate: Relocate):
+        for entry_key, (value, expires_at, offset) in self._entries.items():
+            self._entries[entry_key] = (value, expires_at, relocate(offset))
+
+    def close(self):
+        self.journal.close()
+
+
+class SQLiteStateBackend(StateBackend):
+    """SQLite store in WAL mode; each write is a single-row upsert.
+
+    Every read goes to the database, so several processes can share one file.
+    """
+
+    def __init__(self, path: str = "agent_state.db"):
+        self.path = path
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS state (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_state_expires_at ON state (expires_at)")
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread; autocommit so every statement is its own transaction."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = connect_sqlite(self.path)
+        return conn
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        row = (
+            self._conn()
+            .execute(
+                "SELECT value FROM state WHERE namespace = ? AND key = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, key, time.time()),
+            )
+            .fetchone()
+        )
+        return json.loads(row[0]) if row else None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: float | None = None):
+        self._conn().execute(
+            "INSERT INTO state (namespace, key, value, expires_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (namespace, key) DO UPDATE "
+            "SET value = excluded.value, expires_at = excluded.expires_at",
+            (namespace, key, json.dumps(value), self._expires_at(ttl)),
+        )
+
+    def add(self, namespace: str, key: str, value: Any, ttl: float | None = None) -> bool:
+        now = time.time()
+        # Only an expired row may be overwritten; a live one leaves rowcount at 0
+        cursor = self._conn().execute(
+            "INSERT INTO state (namespace, key, value, expires_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (namespace, key) DO UPDATE "
+            "SET value = excluded.value, expires_at = excluded.expires_at "
+            "WHERE state.expires_at IS NOT NULL AND state.expires_at <= ?",
+            (namespace, key, json.dumps(value), self._expires_at(ttl), now),
+        )
+        return cursor.rowcount > 0
+
+    def delete(self, namespace: str, key: str) -> bool:
+        cursor = self._conn().execute(
+            "DELETE FROM state WHERE namespace = ? AND key = ?", (namespace, key)
+        )
+        return cursor.rowcount > 0
+
+    def sweep(self) -> int:
+        cursor = self._conn().execute(
+            "DELETE FROM state WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+        )
+        return cursor.rowcount
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class RedisStateBackend(StateBackend):
+    """Redis store. Expiry is native (PX), so there is nothing to sweep.
+
+    Pass `client` to use an existing connection (e.g. `fakeredis.FakeRedis()`).
+    """
+
+    def __init__(self, url: str | None = None, client: Any = None, prefix: str = "sfh"):
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(url or settings.redis_url)
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        raw = self.client.get(self._key(namespace, key))
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: float | None = None):
+        self.client.set(
+            self._key(namespace, key), json.dumps(value), px=int(ttl * 1000) if ttl else None
+        )
+
+    def add(self, namespace: str, key: str, value: Any, ttl: float | None = None) -> bool:
+        return bool(
+            self.client.set(
+                self._key(namespace, key),
+                json.dumps(value),
+                px=int(ttl * 1000) if ttl else None,
+                nx=True,
+            )
+        )
+
+    def delete(self, namespace: str, key: str) -> bool:
+        return self.client.delete(self._key(namespace, key)) > 0
+
+    def close(self):
+        self.client.close()
+
+
+BACKENDS = {
+    "file": lambda: FileStateBackend(settings.state_file),
+    "sqlite": lambda: SQLiteStateBackend(settings.state_db),
+    "redis": lambda: RedisStateBackend(settings.redis_url),
+}
+
+_backend: StateBackend | None = None
+_lock = threading.Lock()
+
+
+def get_state_backend() -> StateBackend:
+    """Get the process-wide state backend selected by `settings.state_backend`."""
+    global _backend
+
+    with _lock:
+        if _backend is None:
+            name = settings.state_backend.lower()
+            if name not in BACKENDS:
+                raise ValueError(f"Unsupported state backend: {settings.state_backend}")
+            _backend = BACKENDS[name]()
+            _backend.start_sweeper(settings.state_sweep_interval)
+        return _backend
+
+
+__all__ = [
+    "StateBackend",
+    "FileStateBackend",
+    "SQLiteStateBackend",
+    "RedisStateBackend",
+    "get_state_backend",
+    "connect_sqlite",
+]
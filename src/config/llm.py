@@ -1,80 +1,298 @@
 """LLM client wrapper supporting multiple providers."""
 
-from typing import Any
+import re
+import threading
+from typing import Any, Dict, Optional, Tuple
 
+import httpx
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
+from openai import OpenAI
 
 from src.config.settings import settings
 
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+OPENROUTER_HEADERS = {
+    "HTTP-Referer": "https://github.com/singforhope/newsletter-manager",
+    "X-Title": "Newsletter Manager",
+}
+
+
+# Model tiers, cheapest first
+FAST = "fast"
+STANDARD = "standard"
+PREMIUM = "premium"
+TIERS = (FAST, STANDARD, PREMIUM)
+
+# Word lists for classifying Slack messages without a model call
+GREETING_WORDS = frozenset(
+    "hi hello hey hiya yo good morning afternoon evening thanks thank you thx cheers "
+    "ok okay great cool nice bye there team all so much again".split()
+)
+VAGUE_WORDS = frozenset(
+    "help what can you do how does this work options menu start please me i we want to "
+    "need would like a an the new article articles post news newsletter create write draft "
+    "something".split()
+)
+GENERATE_PATTERN = re.compile(
+    r"\b(write|generate|compose|rewrite|regenerate|shorter|longer|turn .+ into)\b"
+    r"|\bdraft (a|an|the|me|some|something|up)\b"
+)
+MODIFY_PATTERN = re.compile(
+    r"\b(create|add|update|edit|change|rename|set|publish|unpublish|delete|remove|archive)\b"
+)
+LIST_PATTERN = re.compile(
+    r"^(list|show)\b|\b(list|show|what|which|how many|any)\b.*"
+    r"\b(articles?|drafts?|posts?|published|unpublished)\b"
+)
+SEARCH_PATTERN = re.compile(r"\b(search|find|look up|look for)\b")
+# Longer messages carry pasted content or detailed instructions; keep them off the fast tier
+MAX_FAST_CHARS = 280
+
+
+class ModelRouter:
+    """Assigns a model tier to each agent, tool and message intent.
+
+    Turns that only chat, clarify, list or search at the start of a conversation run on
+    the fast tier, agent turns that change articles (and anything mid-conversation) on
+    standard, and only Generate Content on premium. Each tier's model
+    comes from settings (LLM_FAST_MODEL, LLM_STANDARD_MODEL, LLM_PREMIUM_MODEL).
+    """
+
+    ROUTES: Dict[str, str] = {
+        "agent:newsletter_manager": STANDARD,
+        "agent:content_generator": STANDARD,
+        "tool:generate_content": PREMIUM,
+        "tool:analyze_image": STANDARD,
+        "intent:greeting": FAST,
+        "intent:clarify": FAST,
+        "intent:list": FAST,
+        "intent:search": FAST,
+        "intent:generate": STANDARD,
+        "intent:modify": STANDARD,
+        "intent:other": STANDARD,
+    }
+
+    def tier(self, kind: str, name: str) -> str:
+        """Tier for e.g. ("tool", "generate_content"); unknown names get standard."""
+        return self.ROUTES.get(f"{kind}:{name}", STANDARD)
+
+    def model(self, tier: str) -> str:
+        """Model configured for a tier."""
+        if tier not in TIERS:
+            raise ValueError(f"Unknown model tier: {tier}")
+        if not settings.llm_routing:
+            return settings.default_model
+        configured = {
+            FAST: settings.llm_fast_model,
+            STANDARD: settings.llm_standard_model,
+            PREMIUM: settings.llm_premium_model,
+        }[tier]
+        return configured or settings.default_model
+
+    def model_for(self, kind: str, name: str) -> str:
+        return self.model(self.tier(kind, name))
+
+    def route(self, text: str, has_files: bool = False, ongoing: bool = False) -> Tuple[str, str]:
+        """(intent, tier) for a Slack message.
+
+        `ongoing` is True when the message continues a conversation (a thread reply,
+        earlier history or a pending action). A short "ok" or "thanks" there may answer
+        a clarifying question or a confirmation, so it is never sent to the fast tier.
+        """
+        intent = self.classify(text, has_files)
+        tier = self.tier("intent", intent)
+        if ongoing and tier == FAST:
+            tier = STANDARD
+        return intent, tier
+
+    @staticmethod
+    def classify(text: str, has_files: bool = False) -> str:
+        """Intent of a Slack message from keyword rules; "other" when unsure."""
+        text = text.lower().strip()
+        words = re.findall(r"[a-z']+", text)
+        if GENERATE_PATTERN.search(text) and not set(words) <= VAGUE_WORDS:
+            return "generate"
+        if has_files or len(text) > MAX_FAST_CHARS:
+            return "generate" if GENERATE_PATTERN.search(text) else "other"
+        if not words or set(words) <= GREETING_WORDS:
+            return "greeting"
+        if set(words) <= VAGUE_WORDS:
+            return "clarify"
+        if MODIFY_PATTERN.search(text):
+            return "modify"
+        if LIST_PATTERN.search(text):
+            return "list"
+        if SEARCH_PATTERN.search(text):
+            return "search"
+        return "other"
+
 
 class LLMClient:
-    """LLM client wrapper for multiple providers."""
+    """LLM client wrapper for multiple providers.
+
+    Also a registry of long-lived clients: each (provider, model, purpose, temperature)
+    gets one instance, built on first use and reused afterwards, and OpenAI-compatible
+    clients share one pooled HTTP client per endpoint, so calls reuse open connections
+    and TLS sessions instead of paying for a new handshake each time.
+    """
 
     def __init__(self) -> None:
         """Initialize LLM client based on settings."""
         self.provider = settings.default_llm.lower()
         self.model_name = settings.default_model
-        self._client: Any = None
-
-    def get_llm(self) -> Any:
-        """Get the configured LLM instance."""
-        if self._client is not None:
-            return self._client
-
-        if self.provider == "openai":
-            if not settings.openai_api_key:
-                raise ValueError("OPENAI_API_KEY not configured")
-            self._client = ChatOpenAI(
-                model=self.model_name,
-                api_key=settings.openai_api_key,
-                temperature=0.7,
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple, Any] = {}
+        self._http_clients: Dict[str, httpx.Client] = {}
+        self.created = 0
+        self.reused = 0
+
+    def get_llm(self, tier: str = STANDARD) -> Any:
+        """Get the agent LLM for a model tier."""
+        return self.get_chat_model(purpose="agent", model=model_router.model(tier))
+
+    def get_chat_model(
+        self,
+        purpose: str = "default",
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+    ) -> Any:
+        """Get the shared LangChain chat model for this provider, model and purpose."""
+        provider = (provider or self.provider).lower()
+        model = model or self.model_name
+        return self._get(
+            ("chat", provider, model, purpose, temperature),
+            lambda: self._build_chat_model(provider, model, temperature),
+        )
+
+    def get_openai_client(self, purpose: str = "default", provider: Optional[str] = None) -> OpenAI:
+        """Get a shared raw OpenAI SDK client (e.g. for image generation)."""
+        provider = (provider or self.provider).lower()
+        if provider not in ("openai", "openrouter"):
+            raise ValueError(f"Provider {provider} has no OpenAI-compatible API")
+
+        def build() -> OpenAI:
+            base_url = self._base_url(provider)
+            return OpenAI(
+                api_key=self._openai_key(provider),
+                base_url=base_url,
+                default_headers=OPENROUTER_HEADERS if provider == "openrouter" else None,
+                http_client=self._http_client(base_url),
+            )
+
+        return self._get(("openai", provider, purpose), build)
+
+    def _get(self, key: Tuple, build) -> Any:
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = build()
+                self.created += 1
+            else:
+                self.reused += 1
+            return client
+
+    @staticmethod
+    def _base_url(provider: str) -> Optional[str]:
+        if settings.llm_base_url:
+            return settings.llm_base_url
+        return OPENROUTER_BASE_URL if provider == "openrouter" else None
+
+    @staticmethod
+    def _openai_key(provider: str) -> str:
+        if not settings.openai_api_key:
+            if provider == "openrouter":
+                raise ValueError(
+                    "OPENAI_API_KEY not configured (OpenRouter uses OpenAI-compatible API)"
+                )
+            raise ValueError("OPENAI_API_KEY not configured")
+        return settings.openai_api_key
+
+    def _http_client(self, base_url: Optional[str]) -> httpx.Client:
+        """One connection pool per endpoint, shared by every client that talks to it."""
+        key = base_url or "default"
+        client = self._http_clients.get(key)
+        if client is None:
+            client = self._http_clients[key] = httpx.Client(
+                timeout=settings.llm_timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.llm_max_connections,
+                    max_keepalive_connections=settings.llm_max_connections,
+                    keepalive_expiry=settings.llm_keepalive_expiry,
+                ),
             )
+        return client
 
-        elif self.provider == "openrouter":
-            if not settings.openai_api_key:
-                raise ValueError("OPENAI_API_KEY not configured (OpenRouter uses OpenAI-compatible API)")
+    def _build_chat_model(self, provider: str, model: str, temperature: float) -> Any:
+        if provider == "openai":
+            base_url = self._base_url(provider)
+            return ChatOpenAI(
+                model=model,
+                api_key=self._openai_key(provider),
+                base_url=base_url,
+                temperature=temperature,
+                http_client=self._http_client(base_url),
+            )
+
+        elif provider == "openrouter":
             # OpenRouter uses OpenAI-compatible API
-            self._client = ChatOpenAI(
-                model=self.model_name,
-                api_key=settings.openai_api_key,
-                base_url="https://openrouter.ai/api/v1",
-                temperature=0.7,
-                default_headers={
-                    "HTTP-Referer": "https://github.com/singforhope/newsletter-manager",
-                    "X-Title": "Newsletter Manager",
-                },
+            base_url = self._base_url(provider)
+            return ChatOpenAI(
+                model=model,
+                api_key=self._openai_key(provider),
+                base_url=base_url,
+                temperature=temperature,
+                default_headers=OPENROUTER_HEADERS,
+                http_client=self._http_client(base_url),
             )
 
-        elif self.provider == "anthropic":
+        elif provider == "anthropic":
             if not settings.anthropic_api_key:
                 raise ValueError("ANTHROPIC_API_KEY not configured")
-            self._client = ChatAnthropic(
-                model=self.model_name,
+            return ChatAnthropic(
+                model=model,
                 api_key=settings.anthropic_api_key,
-                temperature=0.7,
+                temperature=temperature,
             )
 
-        elif self.provider == "google":
+        elif provider == "google":
             if not settings.google_api_key:
                 raise ValueError("GOOGLE_API_KEY not configured")
-            self._client = ChatGoogleGenerativeAI(
-                model=self.model_name,
+            return ChatGoogleGenerativeAI(
+                model=model,
                 google_api_key=settings.google_api_key,
-                temperature=0.7,
+                temperature=temperature,
             )
 
         else:
-            raise ValueError(f"Unsupported LLM provider: {self.provider}")
+            raise ValueError(f"Unsupported LLM provider: {provider}")
+
+    def stats(self) -> Dict[str, int]:
+        """How many clients were built vs handed out again."""
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "http_pools": len(self._http_clients),
+                "created": self.created,
+                "reused": self.reused,
+            }
 
-        return self._client
+    def close(self) -> None:
+        """Close the shared connection pools (e.g. at shutdown)."""
+        with self._lock:
+            for client in self._http_clients.values():
+                client.close()
+            self._http_clients.clear()
+            self._clients.clear()
 
 
-# Global LLM client
+# Global router and LLM client
+model_router = ModelRouter()
 llm_client = LLMClient()
 
 
-def get_llm() -> Any:
-    """Get the global LLM instance."""
-    return llm_client.get_llm()
+def get_llm(tier: str = STANDARD) -> Any:
+    """Get the global LLM instance for a model tier."""
+    return llm_client.get_llm(tier)
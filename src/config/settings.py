@@ -28,11 +28,18 @@ class Settings(BaseSettings):
     database_url: str
     db_pool_min: int = 2
     db_pool_max: int = 10
+    db_pool_keepalive_expiry: float = 30.0  # seconds an idle connection is kept open
+    article_backend: str = "supabase"  # "supabase" (PostgREST) or "postgres" (direct SQL)
+    search_mode: str = "ilike"  # or "ranked" (full-text) once migrations/003 is applied
+    list_count_mode: str = "estimated"  # "exact", "planned", "estimated" or "none"
+    exact_count_threshold: int = 1000  # "estimated" counts exactly below this many rows
 
     # Supabase
     supabase_url: str
     supabase_key: str
     supabase_bucket: str = "uploads"
+    supabase_timeout: float = 30.0
+    supabase_http2: bool = True
 
     # LLM Providers
     openai_api_key: str | None = None
@@ -42,6 +49,26 @@ class Settings(BaseSettings):
     # Default LLM
     default_llm: str = "openai"
     default_model: str = "gpt-4"
+    # Model tiers (see ModelRouter in src/config/llm.py); empty falls back to default_model.
+    # Names are for DEFAULT_LLM's provider, e.g. "openai/gpt-4o-mini" on OpenRouter.
+    llm_routing: bool = True  # False runs every agent, tool and intent on default_model
+    llm_fast_model: str = ""  # greetings, clarification, listing and search
+    llm_standard_model: str = ""  # agent turns that change articles
+    llm_premium_model: str = ""  # Generate Content drafts
+    llm_base_url: str | None = None  # OpenAI-compatible endpoint override (proxy, local server)
+    llm_timeout: float = 120.0
+    llm_max_connections: int = 20  # per endpoint, shared by all clients talking to it
+    llm_keepalive_expiry: float = 60.0
+    llm_cache_backend: str = "off"  # cache Generate Content results: "off", "sqlite" or "redis"
+    llm_cache_db: str = "llm_cache.db"
+    llm_cache_ttl: int = 86400
+    llm_cache_max_mb: int = 64
+    semantic_cache_enabled: bool = False  # also reuse drafts for paraphrased requests
+    semantic_cache_threshold: float = 0.85  # cosine similarity needed to reuse a draft
+    semantic_cache_max_entries: int = 5000
+    semantic_cache_dim: int = 256  # vector size; 50k entries x 256 floats = 49MB
+    stream_generation: bool = True  # stream Generate Content drafts into the Slack thread
+    stream_update_interval: float = 1.0  # min seconds between chat_update edits (rate limits)
 
     # Slack
     slack_bot_token: str | None = None
@@ -58,7 +85,53 @@ class Settings(BaseSettings):
     # Agent Configuration
     agent_name: str = "Newsletter Manager"
     confirmation_required: bool = True
-    confirmation_timeout: int = 300  # 5 minutes
+    confirmation_timeout: int = 300  # 5 minutes; pending actions expire after this
+    approval_lease_seconds: int = 120  # execution lock per approval; capped below the timeout
+    idempotent_creates: bool = False  # needs migrations/005; approved creates never repeat
+
+    # Agent State (pending actions and conversation memory)
+    # "file" is single-process; use "sqlite" (one host) or "redis" (uses redis_url) to run
+    # several bot processes or a standalone dashboard against the same state
+    state_backend: str = "file"
+    state_file: str = "agent_state.jsonl"
+    state_db: str = "agent_state.db"
+    state_sweep_interval: int = 60  # seconds between purges of expired entries
+
+    # Conversation Memory
+    memory_history_per_thread: int = 10  # messages kept per Slack thread
+    memory_max_threads: int = 500  # threads held in RAM; older ones are read from disk
+    memory_thread_ttl: int = 3600  # seconds a thread stays in RAM after its last use
+    memory_retention_days: int = 30  # forget threads idle this long; 0 keeps them forever
+
+    # Slack event processing
+    event_workers: int = 8  # agent runs in parallel (one at a time per Slack thread)
+    event_queue_size: int = 100  # queued requests before new ones are turned away
+    event_dedup_ttl: int = 3600  # seconds a delivered event id is remembered (Slack retries)
+
+    # Slack file uploads
+    max_file_size_mb: int = 10
+    file_download_concurrency: int = 4  # parallel downloads across all requests
+    file_download_timeout: float = 30.0
+    extraction_workers: int = 2  # processes parsing PDF/DOCX
+    extraction_pages_per_task: int = 25  # PDFs longer than this are parsed in parallel ranges
+    extraction_timeout: float = 120.0
+    extraction_char_budget: int = 50000  # per file; parsing stops once this much text is read
+    extraction_cache_enabled: bool = True
+    extraction_cache_dir: str = ".cache/extractions"
+    extraction_cache_max_mb: int = 256
+
+    # Temp files (images handed to the vision tool), scoped per Slack thread
+    temp_file_max_age: int = 3600  # reaper deletes files older than this; 0 disables it
+    temp_reap_interval: int = 300
+    temp_memory_dir: str = ""  # tmpfs for small files, e.g. /dev/shm or "auto"
+    temp_memory_max_kb: int = 2048
+
+    # Dashboard
+    embed_dashboard: bool = True  # run inside the bot process; False when deployed separately
+    dashboard_host: str = "0.0.0.0"
+    dashboard_port: int = 8000
+    dashboard_workers: int = 1  # standalone only: python -m src.dashboard
+    dashboard_url: str = "http://localhost:8000"  # base URL used in Slack preview links
 
     # Content Generation
     content_default_tone: str = "inspiring"
@@ -73,6 +146,7 @@ class Settings(BaseSettings):
     content_gen_rate_limit: int = 10  # per minute
     image_gen_rate_limit: int = 5  # per minute
     max_bulk_size: int = 50
+    bulk_chunk_size: int = 25  # articles per set-based statement in bulk operations
 
     # Redis (for memory/cache)
     redis_url: str = "redis://localhost:6379/0"
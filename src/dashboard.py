@@ -4,6 +4,8 @@ import markdown
 import logging
 
 from src.agents.state import state_manager
+from src.config.settings import settings
+from src.utils.llm_cache import get_response_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -15,6 +17,33 @@ app = FastAPI(title="Newsletter Manager Dashboard")
 def home():
     return {"status": "online", "message": "Newsletter Manager Dashboard is running"}
 
+# The bot's Slack event pool, when the dashboard runs inside the bot process
+_event_pool = None
+
+
+def attach_event_pool(pool):
+    """Expose the bot's event pool at /metrics/events (embedded dashboard)."""
+    global _event_pool
+    _event_pool = pool
+
+
+@app.get("/metrics/events")
+def event_metrics():
+    """Event pool queue depth and throughput."""
+    if _event_pool is None:
+        raise HTTPException(
+            status_code=503,
+            detail="The event pool lives in the bot process; use the embedded dashboard",
+        )
+    return _event_pool.stats()
+
+
+@app.get("/metrics/llm-cache")
+def llm_cache_metrics():
+    """Generate Content cache hit rate (shared when LLM_CACHE_BACKEND is sqlite or redis)."""
+    cache = get_response_cache()
+    return cache.stats() if cache else {"backend": "off"}
+
 @app.get("/preview/pending/{thread_ts}", response_class=HTMLResponse)
 def preview_pending_action(thread_ts: str):
     """
@@ -83,5 +112,16 @@ def preview_pending_action(thread_ts: str):
     return html
 
 if __name__ == "__main__":
+    # Standalone: python -m src.dashboard (set EMBED_DASHBOARD=false for the bot)
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    if settings.state_backend == "file":
+        logger.warning(
+            "STATE_BACKEND=file keeps pending actions inside the bot process; this dashboard "
+            "will not see them. Use sqlite or redis when running the dashboard on its own."
+        )
+    uvicorn.run(
+        "src.dashboard:app",
+        host=settings.dashboard_host,
+        port=settings.dashboard_port,
+        workers=settings.dashboard_workers,
+    )
@@ -1,6 +1,18 @@
 """Database package."""
 
-from src.database.client import DatabaseClient, db_client, get_db
+from src.database.client import DatabaseClient, get_db, get_db_client
 from src.database.models import News, Base
+from src.database.repository import ArticleRepository, get_article_repository
+from src.database.rest import close_supabase, get_supabase
 
-__all__ = ["News", "Base", "DatabaseClient", "db_client", "get_db"]
+__all__ = [
+    "News",
+    "Base",
+    "DatabaseClient",
+    "get_db_client",
+    "get_db",
+    "get_supabase",
+    "close_supabase",
+    "ArticleRepository",
+    "get_article_repository",
+]
@@ -1,10 +1,13 @@
 """Database client for Supabase connection."""
 
+import threading
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from supabase import Client, create_client
+from supabase import Client
 
 from src.config.settings import settings
+from src.database.rest import get_supabase
 
 
 class DatabaseClient:
@@ -25,11 +28,8 @@ class DatabaseClient:
             bind=self.engine,
         )
 
-        # Supabase client (for storage and realtime features)
-        self.supabase: Client = create_client(
-            settings.supabase_url,
-            settings.supabase_key,
-        )
+        # Supabase client (for storage and realtime features), shared with the tools
+        self.supabase: Client = get_supabase()
 
     def get_session(self) -> Session:
         """Get a database session."""
@@ -40,13 +40,27 @@ class DatabaseClient:
         self.engine.dispose()
 
 
-# Global database client
-db_client = DatabaseClient()
+_db_client: DatabaseClient | None = None
+_lock = threading.Lock()
+
+
+def get_db_client() -> DatabaseClient:
+    """Process-wide database client, created on first use.
+
+    Building the engine needs a database driver and a valid DATABASE_URL, so it is
+    deferred until something actually talks to Postgres directly.
+    """
+    global _db_client
+
+    with _lock:
+        if _db_client is None:
+            _db_client = DatabaseClient()
+        return _db_client
 
 
 def get_db() -> Session:
     """Dependency for getting database session."""
-    session = db_client.get_session()
+    session = get_db_client().get_session()
     try:
         yield session
     finally:
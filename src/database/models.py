@@ -55,6 +55,9 @@ class News(Base):
     tiny: Mapped[str | None] = mapped_column(Text, nullable=True)
     sun: Mapped[Any | None] = mapped_column(JSON, nullable=True)
 
+    # Set by approved Slack actions so a repeated approval cannot insert twice
+    idempotency_key: Mapped[str | None] = mapped_column(Text, nullable=True, unique=True)
+
     def __repr__(self) -> str:
         """String representation."""
         status = "DRAFT" if self.draft else "PUBLISHED"
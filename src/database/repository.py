@@ -0,0 +1,660 @@
+"""Article repository with PostgREST (Supabase) and direct Postgres backends."""
+
+import base64
+import binascii
+import json
+import threading
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Any, Literal
+
+from sqlalchemy import delete, func, insert, or_, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.config.settings import settings
+from src.database.models import News
+from src.database.rest import get_supabase
+
+ArticleStatus = Literal["draft", "published", "all"]
+SearchMode = Literal["ranked", "ilike"]
+CountMode = Literal["exact", "planned", "estimated", "none"]
+DraftChange = Literal["updated", "unchanged", "not_found"]
+BulkResult = dict[str, list[dict[str, Any]]]
+Cursor = tuple[str, int]
+
+# Bookkeeping columns that are never returned to tools
+INTERNAL_COLUMNS = ("search_vector", "idempotency_key")
+
+# Explicit column list so PostgREST never returns the internal columns
+ARTICLE_COLUMNS = [
+    column.name for column in News.__table__.c if column.name not in INTERNAL_COLUMNS
+]
+
+# Compact shape for search/list results; full rows are fetched lazily via Read Article
+SUMMARY_COLUMNS = [
+    "id",
+    "news_title",
+    "news_excerpt",
+    "news_url",
+    "draft",
+    "news_date",
+    "created_at",
+    "news_updated",
+]
+
+# Extra columns returned by ranked search alongside the article fields
+RANKED_EXTRAS = ["rank", "snippet"]
+
+RANKED_SEARCH_SQL = text(
+    "SELECT * FROM search_news(:query, :status, :max_results, :result_offset)"
+)
+
+# Conditional draft flip in one statement. `target` reads the row as it was, `changed`
+# only matches if the flag actually differs (re-checked under concurrent writes), so
+# "not found", "already in that state" and "updated" come back from one round trip.
+SET_DRAFT_SQL = text(
+    f"""
+    WITH target AS (
+        SELECT id, news_title, draft FROM news WHERE id = :article_id
+    ),
+    changed AS (
+        UPDATE news SET draft = :draft
+        WHERE id = :article_id AND draft IS DISTINCT FROM :draft
+        RETURNING {", ".join(ARTICLE_COLUMNS)}
+    )
+    SELECT target.news_title AS _current_title, changed.*
+    FROM target LEFT JOIN changed ON TRUE
+    """
+)
+
+# Set-based version of SET_DRAFT_SQL for one chunk of IDs
+BULK_SET_DRAFT_SQL = text(
+    """
+    WITH target AS (
+        SELECT id, news_title FROM news WHERE id = ANY(:ids)
+    ),
+    changed AS (
+        UPDATE news SET draft = :draft
+        WHERE id = ANY(:ids) AND draft IS DISTINCT FROM :draft
+        RETURNING id
+    )
+    SELECT target.id, target.news_title, changed.id IS NOT NULL AS changed
+    FROM target LEFT JOIN changed ON changed.id = target.id
+    """
+)
+
+
+def encode_cursor(row: dict[str, Any]) -> str:
+    """Build an opaque keyset cursor pointing just past `row`."""
+    raw = json.dumps([row["created_at"], row["id"]]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Decode a cursor from `encode_cursor` into (created_at, id)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, article_id = json.loads(raw)
+        return str(created_at), int(article_id)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+class ArticleRepository(ABC):
+    """Storage operations used by the article tools.
+
+    Rows are returned as plain dicts with ISO-formatted timestamps, the same
+    shape PostgREST returns, so tools behave identically on every backend.
+    """
+
+    @abstractmethod
+    def create(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Insert an article and return the stored row.
+
+        If `data` carries an `idempotency_key` that was already used, nothing is written
+        and the article created with that key is returned instead.
+        """
+
+    @abstractmethod
+    def get(
+        self,
+        article_id: int | None = None,
+        news_url: str | None = None,
+        columns: list[str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Fetch one article by ID or URL slug (all columns by default)."""
+
+    @abstractmethod
+    def get_many(
+        self, article_ids: list[int], columns: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch several articles by ID (in no particular order)."""
+
+    @abstractmethod
+    def update(self, article_id: int, data: dict[str, Any]) -> dict[str, Any] | None:
+        """Update an article and return the new row, or None if it does not exist."""
+
+    @abstractmethod
+    def delete(self, article_id: int) -> dict[str, Any] | None:
+        """Delete an article and return the removed row, or None if it does not exist."""
+
+    @abstractmethod
+    def set_draft(self, article_id: int, draft: bool) -> tuple[DraftChange, dict[str, Any] | None]:
+        """Set the draft flag only if it differs, in a single conditional write.
+
+        Returns ("updated", new row), ("unchanged", {"news_title": ...}) when the
+        article already has that status, or ("not_found", None).
+        """
+
+    @abstractmethod
+    def _set_draft_chunk(
+        self, article_ids: list[int], draft: bool
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Set-based draft flip; returns (changed, already-in-state) as id/title rows."""
+
+    @abstractmethod
+    def _update_chunk(self, article_ids: list[int], data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Set-based update; returns id/title rows that were updated."""
+
+    @abstractmethod
+    def _delete_chunk(self, article_ids: list[int]) -> list[dict[str, Any]]:
+        """Set-based delete; returns id/title rows that were removed."""
+
+    def _run_bulk(self, article_ids: list[int], apply: Any) -> BulkResult:
+        """Apply a chunk operation over all IDs, collecting per-item outcomes.
+
+        `apply(chunk)` returns (succeeded rows, skipped rows). IDs in neither are
+        reported as not found; a chunk that raises marks its IDs as failed and the
+        remaining chunks still run.
+        """
+        result: BulkResult = {"succeeded": [], "skipped": [], "not_found": [], "failed": []}
+        unique_ids = list(dict.fromkeys(article_ids))
+        size = max(settings.bulk_chunk_size, 1)
+
+        for start in range(0, len(unique_ids), size):
+            chunk = unique_ids[start : start + size]
+            try:
+                succeeded, skipped = apply(chunk)
+            except Exception as e:
+                result["failed"].extend({"id": article_id, "error": str(e)} for article_id in chunk)
+                continue
+
+            seen = {row["id"] for row in succeeded} | {row["id"] for row in skipped}
+            result["succeeded"].extend(succeeded)
+            result["skipped"].extend(skipped)
+            result["not_found"].extend({"id": i} for i in chunk if i not in seen)
+        return result
+
+    def bulk_set_draft(self, article_ids: list[int], draft: bool) -> BulkResult:
+        """Publish (draft=False) or unpublish many articles in chunks.
+
+        Articles already in the target state are reported under "skipped".
+        """
+        return self._run_bulk(article_ids, lambda chunk: self._set_draft_chunk(chunk, draft))
+
+    def bulk_update(self, article_ids: list[int], data: dict[str, Any]) -> BulkResult:
+        """Apply the same field changes to many articles in chunks."""
+        return self._run_bulk(article_ids, lambda chunk: (self._update_chunk(chunk, data), []))
+
+    def bulk_delete(self, article_ids: list[int]) -> BulkResult:
+        """Delete many articles in chunks."""
+        return self._run_bulk(article_ids, lambda chunk: (self._delete_chunk(chunk), []))
+
+    @abstractmethod
+    def _ranked_search(
+        self, keyword: str, status: ArticleStatus, limit: int, offset: int
+    ) -> list[dict[str, Any]]:
+        """Run `search_news` and return its rows, including `total_count`."""
+
+    @abstractmethod
+    def _filtered_search(
+        self,
+        keyword: str | None,
+        status: ArticleStatus,
+        limit: int,
+        offset: int,
+        columns: list[str],
+        cursor: Cursor | None,
+        count: CountMode,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Listing ordered by (created_at, id) descending, with an optional ilike filter.
+
+        With a cursor, rows strictly after it are returned and no count is taken.
+        """
+
+    def search(
+        self,
+        keyword: str | None = None,
+        status: ArticleStatus = "all",
+        limit: int = 20,
+        offset: int = 0,
+        mode: SearchMode = "ranked",
+        columns: list[str] | None = None,
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> tuple[list[dict[str, Any]], int | None, str | None]:
+        """Search articles, returning (rows, total matching count, next cursor).
+
+        With a keyword, "ranked" mode uses the `search_news` function from
+        migrations/003 (full-text rank plus fuzzy title match, with `rank` and a
+        highlighted `snippet`) and pages by offset. Otherwise rows are listed newest
+        first with keyset pagination: pass the returned cursor back to get the next
+        page in constant time ("ilike" mode adds a substring filter). `count` picks
+        how the total is computed ("planned"/"estimated" avoid a full count) and is
+        skipped on cursor pages. Only `columns` are returned (all by default).
+        """
+        columns = columns or ARTICLE_COLUMNS
+        if not (keyword and mode == "ranked"):
+            # The cursor is built from the sort key, so it must always be selected
+            selected = list(dict.fromkeys([*columns, "created_at", "id"]))
+            position = decode_cursor(cursor) if cursor else None
+            rows, total = self._filtered_search(
+                keyword, status, limit, offset, selected, position, count
+            )
+            next_cursor = encode_cursor(rows[-1]) if len(rows) == limit else None
+            rows = [{k: v for k, v in row.items() if k in columns} for row in rows]
+            return rows, total, next_cursor
+
+        rows, total = _split_total(self._ranked_search(keyword, status, limit, offset))
+        missing = [name for name in columns if rows and name not in rows[0]]
+        if missing:
+            # search_news only returns summary fields; fetch the rest for this page
+            extra = self.get_many([row["id"] for row in rows], ["id", *missing])
+            by_id = {row["id"]: row for row in extra}
+            for row in rows:
+                row.update(by_id.get(row["id"], {}))
+
+        keep = set(columns) | set(RANKED_EXTRAS)
+        return [{k: v for k, v in row.items() if k in keep} for row in rows], total, None
+
+
+class SupabaseArticleRepository(ArticleRepository):
+    """Repository backed by PostgREST through the shared Supabase client."""
+
+    table = "news"
+
+    @staticmethod
+    def _first(rows: list[dict[str, Any]]) -> dict[str, Any] | None:
+        """First row of a write response, minus the internal columns."""
+        if not rows:
+            return None
+        row = rows[0]
+        for column in INTERNAL_COLUMNS:
+            row.pop(column, None)
+        return row
+
+    def create(self, data: dict[str, Any]) -> dict[str, Any]:
+        table = get_supabase().table(self.table)
+        key = data.get("idempotency_key")
+        if key is None:
+            result = table.insert(data).execute()
+            if not result.data:
+                raise Exception("No data returned from insert")
+            return self._first(result.data)
+
+        # ON CONFLICT DO NOTHING: a repeated key returns no row instead of inserting
+        result = table.upsert(data, on_conflict="idempotency_key", ignore_duplicates=True).execute()
+        if result.data:
+            return self._first(result.data)
+        existing = (
+            table.select(",".join(ARTICLE_COLUMNS)).eq("idempotency_key", key).limit(1).execute()
+        )
+        if not existing.data:
+            raise Exception("No data returned from insert")
+        return existing.data[0]
+
+    def get(
+        self,
+        article_id: int | None = None,
+        news_url: str | None = None,
+        columns: list[str] | None = None,
+    ) -> dict[str, Any] | None:
+        query = get_supabase().table(self.table).select(",".join(columns or ARTICLE_COLUMNS))
+        if article_id:
+            query = query.eq("id", article_id)
+        else:
+            query = query.eq("news_url", news_url)
+        result = query.limit(1).execute()
+        return result.data[0] if result.data else None
+
+    def get_many(
+        self, article_ids: list[int], columns: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        if not article_ids:
+            return []
+        query = get_supabase().table(self.table).select(",".join(columns or ARTICLE_COLUMNS))
+        return query.in_("id", article_ids).execute().data
+
+    def update(self, article_id: int, data: dict[str, Any]) -> dict[str, Any] | None:
+        result = get_supabase().table(self.table).update(data).eq("id", article_id).execute()
+        return self._first(result.data)
+
+    def delete(self, article_id: int) -> dict[str, Any] | None:
+        result = get_supabase().table(self.table).delete().eq("id", article_id).execute()
+        return self._first(result.data)
+
+    def set_draft(self, article_id: int, draft: bool) -> tuple[DraftChange, dict[str, Any] | None]:
+        result = (
+            get_supabase()
+            .table(self.table)
+            .update({"draft": draft})
+            .eq("id", article_id)
+            .neq("draft", draft)
+            .execute()
+        )
+        if result.data:
+            return "updated", self._first(result.data)
+
+        # Nothing changed: only now pay for a lookup to tell the two cases apart
+        current = self.get(article_id=article_id, columns=["news_title"])
+        return ("unchanged", current) if current else ("not_found", None)
+
+    @staticmethod
+    def _brief(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [{"id": row["id"], "news_title": row["news_title"]} for row in rows]
+
+    def _set_draft_chunk(
+        self, article_ids: list[int], draft: bool
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        table = get_supabase().table(self.table)
+        changed = self._brief(
+            table.update({"draft": draft}).in_("id", article_ids).neq("draft", draft).execute().data
+        )
+        remaining = [i for i in article_ids if i not in {row["id"] for row in changed}]
+        unchanged = self.get_many(remaining, ["id", "news_title"]) if remaining else []
+        return changed, unchanged
+
+    def _update_chunk(self, article_ids: list[int], data: dict[str, Any]) -> list[dict[str, Any]]:
+        table = get_supabase().table(self.table)
+        return self._brief(table.update(data).in_("id", article_ids).execute().data)
+
+    def _delete_chunk(self, article_ids: list[int]) -> list[dict[str, Any]]:
+        table = get_supabase().table(self.table)
+        return self._brief(table.delete().in_("id", article_ids).execute().data)
+
+    def _ranked_search(
+        self, keyword: str, status: ArticleStatus, limit: int, offset: int
+    ) -> list[dict[str, Any]]:
+        params = {
+            "query": keyword,
+            "status": status,
+            "max_results": limit,
+            "result_offset": offset,
+        }
+        return get_supabase().rpc("search_news", params).execute().data
+
+    def _filtered_search(
+        self,
+        keyword: str | None,
+        status: ArticleStatus,
+        limit: int,
+        offset: int,
+        columns: list[str],
+        cursor: Cursor | None,
+        count: CountMode,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        count_method = None if cursor or count == "none" else count
+        query = get_supabase().table(self.table).select(",".join(columns), count=count_method)
+
+        if status == "draft":
+            query = query.eq("draft", True)
+        elif status == "published":
+            query = query.eq("draft", False)
+
+        conditions = []
+        if keyword:
+            conditions.append(f"or(news_title.ilike.%{keyword}%,newscontent.ilike.%{keyword}%)")
+        if cursor:
+            created_at, last_id = cursor
+            after = f'created_at.lt."{created_at}"'
+            tie = f'and(created_at.eq."{created_at}",id.lt.{last_id})'
+            conditions.append(f"or({after},{tie})")
+        if conditions:
+            # A single OR over one AND node keeps both groups in one PostgREST logic tree
+            query = query.or_(f"and({','.join(conditions)})")
+
+        query = query.order("created_at", desc=True).order("id", desc=True)
+        query = query.limit(limit) if cursor else query.range(offset, offset + limit - 1)
+        result = query.execute()
+        return result.data, result.count
+
+
+class PostgresArticleRepository(ArticleRepository):
+    """Repository talking to Postgres directly through the pooled SQLAlchemy engine.
+
+    Statements are SQLAlchemy Core constructs, so they are compiled once and reused
+    from the engine's statement cache (and prepared server-side when DATABASE_URL uses
+    the psycopg 3 driver); writes use RETURNING to avoid a follow-up read.
+    """
+
+    def __init__(self) -> None:
+        # Imported here so the PostgREST backend never needs a database driver
+        from src.database.client import get_db_client
+
+        self.engine = get_db_client().engine
+        self.table = News.__table__
+
+    @staticmethod
+    def _to_dict(row: Any) -> dict[str, Any]:
+        """Convert a result row to a PostgREST-shaped dict."""
+        return {
+            key: value.isoformat() if isinstance(value, (datetime, date)) else value
+            for key, value in row._mapping.items()
+        }
+
+    def _columns(self, columns: list[str] | None) -> list[Any]:
+        return [self.table.c[name] for name in columns or ARTICLE_COLUMNS]
+
+    def create(self, data: dict[str, Any]) -> dict[str, Any]:
+        key = data.get("idempotency_key")
+        if key is None:
+            stmt = insert(self.table).values(**data).returning(*self._columns(None))
+            with self.engine.begin() as conn:
+                return self._to_dict(conn.execute(stmt).one())
+
+        stmt = (
+            pg_insert(self.table)
+            .values(**data)
+            .on_conflict_do_nothing(index_elements=["idempotency_key"])
+            .returning(*self._columns(None))
+        )
+        with self.engine.begin() as conn:
+            row = conn.execute(stmt).first()
+            if row is None:
+                # Key already used by an earlier (or concurrent, now committed) approval
+                row = conn.execute(
+                    select(*self._columns(None)).where(self.table.c.idempotency_key == key)
+                ).one()
+        return self._to_dict(row)
+
+    def get(
+        self,
+        article_id: int | None = None,
+        news_url: str | None = None,
+        columns: list[str] | None = None,
+    ) -> dict[str, Any] | None:
+        stmt = select(*self._columns(columns))
+        if article_id:
+            stmt = stmt.where(self.table.c.id == article_id)
+        else:
+            stmt = stmt.where(self.table.c.news_url == news_url)
+        with self.engine.connect() as conn:
+            row = conn.execute(stmt.limit(1)).first()
+        return self._to_dict(row) if row else None
+
+    def get_many(
+        self, article_ids: list[int], columns: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        if not article_ids:
+            return []
+        stmt = select(*self._columns(columns)).where(self.table.c.id.in_(article_ids))
+        with self.engine.connect() as conn:
+            return [self._to_dict(row) for row in conn.execute(stmt)]
+
+    def update(self, article_id: int, data: dict[str, Any]) -> dict[str, Any] | None:
+        stmt = (
+            update(self.table)
+            .where(self.table.c.id == article_id)
+            .values(**data)
+            .returning(*self._columns(None))
+        )
+        with self.engine.begin() as conn:
+            row = conn.execute(stmt).first()
+        return self._to_dict(row) if row else None
+
+    def delete(self, article_id: int) -> dict[str, Any] | None:
+        stmt = (
+            delete(self.table)
+            .where(self.table.c.id == article_id)
+            .returning(*self._columns(None))
+        )
+        with self.engine.begin() as conn:
+            row = conn.execute(stmt).first()
+        return self._to_dict(row) if row else None
+
+    def set_draft(self, article_id: int, draft: bool) -> tuple[DraftChange, dict[str, Any] | None]:
+        with self.engine.begin() as conn:
+            row = conn.execute(SET_DRAFT_SQL, {"article_id": article_id, "draft": draft}).first()
+        if row is None:
+            return "not_found", None
+
+        article = self._to_dict(row)
+        title = article.pop("_current_title")
+        if article["id"] is None:
+            return "unchanged", {"news_title": title}
+        return "updated", article
+
+    def _set_draft_chunk(
+        self, article_ids: list[int], draft: bool
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        with self.engine.begin() as conn:
+            rows = conn.execute(BULK_SET_DRAFT_SQL, {"ids": article_ids, "draft": draft}).all()
+        changed = [{"id": r.id, "news_title": r.news_title} for r in rows if r.changed]
+        unchanged = [{"id": r.id, "news_title": r.news_title} for r in rows if not r.changed]
+        return changed, unchanged
+
+    def _update_chunk(self, article_ids: list[int], data: dict[str, Any]) -> list[dict[str, Any]]:
+        stmt = (
+            update(self.table)
+            .where(self.table.c.id.in_(article_ids))
+            .values(**data)
+            .returning(self.table.c.id, self.table.c.news_title)
+        )
+        with self.engine.begin() as conn:
+            return [self._to_dict(row) for row in conn.execute(stmt)]
+
+    def _delete_chunk(self, article_ids: list[int]) -> list[dict[str, Any]]:
+        stmt = (
+            delete(self.table)
+            .where(self.table.c.id.in_(article_ids))
+            .returning(self.table.c.id, self.table.c.news_title)
+        )
+        with self.engine.begin() as conn:
+            return [self._to_dict(row) for row in conn.execute(stmt)]
+
+    def _ranked_search(
+        self, keyword: str, status: ArticleStatus, limit: int, offset: int
+    ) -> list[dict[str, Any]]:
+        params = {
+            "query": keyword,
+            "status": status,
+            "max_results": limit,
+            "result_offset": offset,
+        }
+        with self.engine.connect() as conn:
+            return [self._to_dict(row) for row in conn.execute(RANKED_SEARCH_SQL, params)]
+
+    def _filtered_search(
+        self,
+        keyword: str | None,
+        status: ArticleStatus,
+        limit: int,
+        offset: int,
+        columns: list[str],
+        cursor: Cursor | None,
+        count: CountMode,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        matches = select(self.table.c.id)
+
+        if status == "draft":
+            matches = matches.where(self.table.c.draft.is_(True))
+        elif status == "published":
+            matches = matches.where(self.table.c.draft.is_(False))
+
+        if keyword:
+            pattern = f"%{keyword}%"
+            matches = matches.where(
+                or_(self.table.c.news_title.ilike(pattern), self.table.c.newscontent.ilike(pattern))
+            )
+
+        page = matches.with_only_columns(*self._columns(columns))
+        if cursor:
+            created_at, last_id = cursor
+            position = tuple_(self.table.c.created_at, self.table.c.id)
+            page = page.where(position < tuple_(datetime.fromisoformat(created_at), last_id))
+        else:
+            page = page.offset(offset)
+        page = page.order_by(self.table.c.created_at.desc(), self.table.c.id.desc()).limit(limit)
+
+        with self.engine.connect() as conn:
+            rows = [self._to_dict(row) for row in conn.execute(page)]
+            total = None if cursor else self._count(conn, matches, count)
+        return rows, total
+
+    def _count(self, conn: Any, matches: Any, count: CountMode) -> int | None:
+        """Count rows for `matches`, mirroring PostgREST's count strategies.
+
+        "planned" reads the planner's row estimate; "estimated" uses it unless it is
+        below `settings.exact_count_threshold`, where an exact count is cheap.
+        """
+        if count == "none":
+            return None
+        if count in ("planned", "estimated"):
+            compiled = matches.compile(dialect=self.engine.dialect)
+            plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+            planned = int(plan.scalar_one()[0]["Plan"]["Plan Rows"])
+            if count == "planned" or planned > settings.exact_count_threshold:
+                return planned
+        return conn.execute(select(func.count()).select_from(matches.subquery())).scalar_one()
+
+
+def _split_total(rows: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], int]:
+    """Pop the window `total_count` column off ranked search rows."""
+    total = rows[0]["total_count"] if rows else 0
+    for row in rows:
+        del row["total_count"]
+    return rows, total
+
+
+REPOSITORIES: dict[str, type[ArticleRepository]] = {
+    "supabase": SupabaseArticleRepository,
+    "postgres": PostgresArticleRepository,
+}
+
+_lock = threading.Lock()
+_repository: ArticleRepository | None = None
+
+
+def get_article_repository() -> ArticleRepository:
+    """Get the process-wide article repository selected by `settings.article_backend`."""
+    global _repository
+
+    with _lock:
+        if _repository is None:
+            backend = settings.article_backend.lower()
+            if backend not in REPOSITORIES:
+                raise ValueError(f"Unsupported article backend: {settings.article_backend}")
+            _repository = REPOSITORIES[backend]()
+        return _repository
+
+
+__all__ = [
+    "ArticleRepository",
+    "SupabaseArticleRepository",
+    "PostgresArticleRepository",
+    "get_article_repository",
+    "encode_cursor",
+    "decode_cursor",
+    "ARTICLE_COLUMNS",
+    "SUMMARY_COLUMNS",
+]
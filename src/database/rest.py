@@ -0,0 +1,95 @@
+"""Shared, pooled Supabase client for PostgREST access."""
+
+import importlib.util
+import logging
+import threading
+
+import httpx
+from postgrest.utils import SyncClient
+from supabase import Client, create_client
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_client: Client | None = None
+_session: SyncClient | None = None
+
+
+def _http2_available() -> bool:
+    """Check whether HTTP/2 support (the `h2` package) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _build_session(base_url: str, headers: httpx.Headers) -> SyncClient:
+    """Build a keep-alive HTTP session sized from the database pool settings."""
+    limits = httpx.Limits(
+        max_connections=settings.db_pool_max,
+        max_keepalive_connections=max(settings.db_pool_min, 1),
+        keepalive_expiry=settings.db_pool_keepalive_expiry,
+    )
+    return SyncClient(
+        base_url=base_url,
+        headers=headers,
+        timeout=settings.supabase_timeout,
+        limits=limits,
+        http2=settings.supabase_http2 and _http2_available(),
+        follow_redirects=True,
+    )
+
+
+def _install_session(client: Client) -> None:
+    """Make the client's PostgREST layer use the shared pooled session.
+
+    supabase-py drops its PostgREST client on auth events, so this is checked on
+    every access and the pooled session is re-attached if it was replaced.
+    """
+    global _session
+
+    postgrest = client.postgrest
+    if _session is not None and postgrest.session is _session:
+        return
+
+    default_session = postgrest.session
+    if _session is None:
+        _session = _build_session(str(default_session.base_url), default_session.headers)
+    else:
+        # Pick up any new auth headers from the rebuilt PostgREST client
+        _session.headers.update(default_session.headers)
+    postgrest.session = _session
+    default_session.close()
+
+
+def get_supabase() -> Client:
+    """Get the process-wide Supabase client.
+
+    The client is created once and reuses pooled keep-alive connections (HTTP/2
+    where available), so tool calls no longer pay for client construction and
+    TLS setup on every request.
+    """
+    global _client
+
+    with _lock:
+        if _client is None:
+            _client = create_client(settings.supabase_url, settings.supabase_key)
+            logger.info(
+                f"Supabase client created (pool {settings.db_pool_min}-{settings.db_pool_max}, "
+                f"http2={settings.supabase_http2 and _http2_available()})"
+            )
+        _install_session(_client)
+        return _client
+
+
+def close_supabase() -> None:
+    """Close the shared session and drop the client (e.g. on shutdown or in tests)."""
+    global _client, _session
+
+    with _lock:
+        if _session is not None:
+            _session.close()
+        _client = None
+        _session = None
+
+
+__all__ = ["get_supabase", "close_supabase"]
@@ -1,5 +1,6 @@
 """CrewAI tools package."""
 
+from src.tools.article_bulk import bulk_delete, bulk_publish, bulk_unpublish, bulk_update
 from src.tools.article_crud import (
     create_article,
     delete_article,
@@ -26,6 +27,10 @@ ALL_TOOLS = [
     delete_article,
     publish_article,
     unpublish_article,
+    bulk_publish,
+    bulk_unpublish,
+    bulk_delete,
+    bulk_update,
     search_articles,
     list_articles,
     ask_clarification,
@@ -43,6 +48,10 @@ __all__ = [
     "delete_article",
     "publish_article",
     "unpublish_article",
+    "bulk_publish",
+    "bulk_unpublish",
+    "bulk_delete",
+    "bulk_update",
     "search_articles",
     "list_articles",
     "ask_clarification",
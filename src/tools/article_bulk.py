@@ -0,0 +1,193 @@
+"""Bulk article operations tool for CrewAI."""
+
+from datetime import datetime
+from typing import Any
+
+from crewai.tools import tool
+
+from src.config.settings import settings
+from src.database.repository import BulkResult, get_article_repository
+
+
+def _check_size(article_ids: list[int]) -> dict[str, Any] | None:
+    """Return an error response if the request is empty or over `max_bulk_size`."""
+    if not article_ids:
+        return {
+            "success": False,
+            "error": "No article IDs provided",
+            "message": "No articles were given for the bulk operation",
+        }
+    if len(set(article_ids)) > settings.max_bulk_size:
+        return {
+            "success": False,
+            "error": "Too many articles",
+            "message": (
+                f"Bulk operations are limited to {settings.max_bulk_size} articles "
+                f"({len(set(article_ids))} requested). Please split the request."
+            ),
+        }
+    return None
+
+
+def _format_ids(rows: list[dict[str, Any]]) -> str:
+    return ", ".join(str(row["id"]) for row in rows)
+
+
+def _bulk_response(verb: str, skipped_reason: str, result: BulkResult) -> dict[str, Any]:
+    """Build a tool response that reports what worked and what didn't."""
+    succeeded = result["succeeded"]
+    total = sum(len(rows) for rows in result.values())
+
+    message = f"{verb} {len(succeeded)} of {total} article(s)."
+    for key, reason in (
+        ("skipped", skipped_reason),
+        ("not_found", "not found"),
+        ("failed", "failed and can be retried"),
+    ):
+        if result[key]:
+            message += f" {len(result[key])} {reason} (ID: {_format_ids(result[key])})."
+
+    return {
+        "success": bool(succeeded) and not result["failed"],
+        "partial": bool(succeeded) and len(succeeded) < total,
+        "articles": succeeded,
+        "skipped": result["skipped"],
+        "not_found": [row["id"] for row in result["not_found"]],
+        "failed": result["failed"],
+        "message": message,
+    }
+
+
+@tool("Bulk Publish")
+def bulk_publish(article_ids: list[int]) -> dict[str, Any]:
+    """
+    Publish several articles at once (set draft=False).
+
+    Args:
+        article_ids: IDs of the articles to publish (required)
+
+    Returns:
+        Dictionary with published articles and per-article problems
+    """
+    error = _check_size(article_ids)
+    if error:
+        return error
+
+    try:
+        result = get_article_repository().bulk_set_draft(article_ids, False)
+        return _bulk_response("Published", "already published", result)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "message": f"Failed to publish articles: {str(e)}",
+        }
+
+
+@tool("Bulk Unpublish")
+def bulk_unpublish(article_ids: list[int]) -> dict[str, Any]:
+    """
+    Unpublish several articles at once (set draft=True).
+
+    Args:
+        article_ids: IDs of the articles to unpublish (required)
+
+    Returns:
+        Dictionary with unpublished articles and per-article problems
+    """
+    error = _check_size(article_ids)
+    if error:
+        return error
+
+    try:
+        result = get_article_repository().bulk_set_draft(article_ids, True)
+        return _bulk_response("Unpublished", "already draft", result)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "message": f"Failed to unpublish articles: {str(e)}",
+        }
+
+
+@tool("Bulk Delete")
+def bulk_delete(article_ids: list[int]) -> dict[str, Any]:
+    """
+    Permanently delete several articles at once.
+
+    Args:
+        article_ids: IDs of the articles to delete (required)
+
+    Returns:
+        Dictionary with deleted articles and per-article problems
+    """
+    error = _check_size(article_ids)
+    if error:
+        return error
+
+    try:
+        result = get_article_repository().bulk_delete(article_ids)
+        return _bulk_response("Deleted", "skipped", result)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "message": f"Failed to delete articles: {str(e)}",
+        }
+
+
+@tool("Bulk Update")
+def bulk_update(
+    article_ids: list[int],
+    news_image: str | None = None,
+    news_image_caption: str | None = None,
+    news_author: str | None = None,
+    related_program: str | None = None,
+) -> dict[str, Any]:
+    """
+    Apply the same change to several articles at once.
+
+    Args:
+        article_ids: IDs of the articles to update (required)
+        news_image: New hero image URL
+        news_image_caption: New image caption
+        news_author: New author name
+        related_program: New related program
+
+    Returns:
+        Dictionary with updated articles and per-article problems
+    """
+    error = _check_size(article_ids)
+    if error:
+        return error
+
+    data = {
+        key: value
+        for key, value in {
+            "news_image": news_image,
+            "news_image_caption": news_image_caption,
+            "news_author": news_author,
+            "related_program": related_program,
+        }.items()
+        if value is not None
+    }
+    if not data:
+        return {
+            "success": False,
+            "error": "No fields to update",
+            "message": "No fields provided to update",
+        }
+    data["news_updated"] = datetime.utcnow().isoformat()
+
+    try:
+        result = get_article_repository().bulk_update(article_ids, data)
+        return _bulk_response("Updated", "skipped", result)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "message": f"Failed to update articles: {str(e)}",
+        }
+
+
+__all__ = ["bulk_publish", "bulk_unpublish", "bulk_delete", "bulk_update"]
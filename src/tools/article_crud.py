@@ -4,14 +4,8 @@ from datetime import datetime
 from typing import Any
 
 from crewai.tools import tool
-from supabase import create_client
 
-from src.config.settings import settings
-
-
-def get_supabase():
-    """Get Supabase client."""
-    return create_client(settings.supabase_url, settings.supabase_key)
+from src.database.repository import get_article_repository
 
 
 @tool("Create Article")
@@ -39,8 +33,39 @@ def create_article(
     Returns:
         Dictionary with article data including ID
     """
+    return _create_article(
+        news_title,
+        newscontent,
+        news_excerpt=news_excerpt,
+        news_image=news_image,
+        news_image_caption=news_image_caption,
+        news_author=news_author,
+        draft=draft,
+    )
+
+
+def create_article_with_key(idempotency_key: str, **tool_args: Any) -> dict[str, Any]:
+    """
+    Run an approved Create Article with the confirmation's idempotency key.
+
+    Not part of the tool schema: a repeated key returns the article created with it,
+    so only approvals (which mint a fresh key per confirmation) may pass one.
+    """
+    return _create_article(**tool_args, idempotency_key=idempotency_key)
+
+
+def _create_article(
+    news_title: str,
+    newscontent: str,
+    news_excerpt: str | None = None,
+    news_image: str | None = None,
+    news_image_caption: str | None = None,
+    news_author: str | None = "Newsletter Manager Bot",
+    draft: bool = True,
+    idempotency_key: str | None = None,
+) -> dict[str, Any]:
     try:
-        supabase = get_supabase()
+        repo = get_article_repository()
         
         data = {
             "news_title": news_title,
@@ -53,13 +78,10 @@ def create_article(
             "draft": draft,
             "created_at": datetime.utcnow().isoformat(),
         }
+        if idempotency_key:
+            data["idempotency_key"] = idempotency_key
         
-        result = supabase.table("news").insert(data).execute()
-        
-        if not result.data:
-            raise Exception("No data returned from insert")
-            
-        article = result.data[0]
+        article = repo.create(data)
         
         return {
             "success": True,
@@ -78,7 +100,8 @@ def create_article(
 @tool("Read Article")
 def read_article(article_id: int | None = None, news_url: str | None = None) -> dict[str, Any]:
     """
-    Read an article by ID or URL slug.
+    Read an article by ID or URL slug, including its full content.
+    Use this to expand a summary result from 'Search Articles' or 'List Articles'.
     
     Args:
         article_id: Article ID
@@ -94,17 +117,9 @@ def read_article(article_id: int | None = None, news_url: str | None = None) ->
         }
     
     try:
-        supabase = get_supabase()
-        query = supabase.table("news").select("*")
-        
-        if article_id:
-            query = query.eq("id", article_id)
-        else:
-            query = query.eq("news_url", news_url)
-            
-        result = query.execute()
+        article = get_article_repository().get(article_id=article_id, news_url=news_url)
         
-        if not result.data:
+        if not article:
             return {
                 "success": False,
                 "error": "Article not found",
@@ -113,7 +128,7 @@ def read_article(article_id: int | None = None, news_url: str | None = None) ->
         
         return {
             "success": True,
-            "article": result.data[0],
+            "article": article,
         }
         
     except Exception as e:
@@ -148,7 +163,7 @@ def update_article(
         Dictionary with updated article data
     """
     try:
-        supabase = get_supabase()
+        repo = get_article_repository()
         
         # Prepare update data
         data = {}
@@ -173,16 +188,14 @@ def update_article(
         # Automatically update news_updated timestamp
         data["news_updated"] = datetime.utcnow().isoformat()
         
-        result = supabase.table("news").update(data).eq("id", article_id).execute()
+        article = repo.update(article_id, data)
         
-        if not result.data:
+        if not article:
             return {
                 "success": False,
                 "error": "Article not found",
                 "message": f"No article found with ID: {article_id}",
             }
-            
-        article = result.data[0]
         
         return {
             "success": True,
@@ -210,21 +223,16 @@ def delete_article(article_id: int) -> dict[str, Any]:
         Dictionary with deletion confirmation
     """
     try:
-        supabase = get_supabase()
-        
-        # Check if exists first to get title
-        check = supabase.table("news").select("news_title").eq("id", article_id).execute()
-        if not check.data:
+        # DELETE ... RETURNING gives us the title without a separate existence check
+        deleted = get_article_repository().delete(article_id)
+        if not deleted:
             return {
                 "success": False,
                 "error": "Article not found",
                 "message": f"No article found with ID: {article_id}",
             }
             
-        title = check.data[0]["news_title"]
-        
-        # Delete
-        supabase.table("news").delete().eq("id", article_id).execute()
+        title = deleted["news_title"]
         
         return {
             "success": True,
@@ -251,33 +259,26 @@ def publish_article(article_id: int) -> dict[str, Any]:
         Dictionary with published article data
     """
     try:
-        supabase = get_supabase()
-        
-        # Check current status
-        check = supabase.table("news").select("draft, news_title").eq("id", article_id).execute()
-        if not check.data:
+        # One conditional write instead of read-then-update (no race window)
+        change, article = get_article_repository().set_draft(article_id, False)
+        if change == "not_found":
             return {
                 "success": False,
                 "error": "Article not found",
                 "message": f"No article found with ID: {article_id}",
             }
             
-        article = check.data[0]
-        if not article["draft"]:
+        if change == "unchanged":
             return {
                 "success": False,
                 "error": "Already published",
                 "message": f"Article '{article['news_title']}' is already published",
             }
             
-        # Update
-        result = supabase.table("news").update({"draft": False}).eq("id", article_id).execute()
-        updated_article = result.data[0]
-        
         return {
             "success": True,
-            "article": updated_article,
-            "message": f"Published article '{updated_article['news_title']}' (ID: {article_id})",
+            "article": article,
+            "message": f"Published article '{article['news_title']}' (ID: {article_id})",
         }
         
     except Exception as e:
@@ -300,33 +301,26 @@ def unpublish_article(article_id: int) -> dict[str, Any]:
         Dictionary with unpublished article data
     """
     try:
-        supabase = get_supabase()
-        
-        # Check current status
-        check = supabase.table("news").select("draft, news_title").eq("id", article_id).execute()
-        if not check.data:
+        # One conditional write instead of read-then-update (no race window)
+        change, article = get_article_repository().set_draft(article_id, True)
+        if change == "not_found":
             return {
                 "success": False,
                 "error": "Article not found",
                 "message": f"No article found with ID: {article_id}",
             }
             
-        article = check.data[0]
-        if article["draft"]:
+        if change == "unchanged":
             return {
                 "success": False,
                 "error": "Already draft",
                 "message": f"Article '{article['news_title']}' is already a draft",
             }
             
-        # Update
-        result = supabase.table("news").update({"draft": True}).eq("id", article_id).execute()
-        updated_article = result.data[0]
-        
         return {
             "success": True,
-            "article": updated_article,
-            "message": f"Unpublished article '{updated_article['news_title']}' (ID: {article_id})",
+            "article": article,
+            "message": f"Unpublished article '{article['news_title']}' (ID: {article_id})",
         }
         
     except Exception as e:
@@ -3,14 +3,9 @@
 from typing import Any, Literal
 
 from crewai.tools import tool
-from supabase import create_client
 
 from src.config.settings import settings
-
-
-def get_supabase():
-    """Get Supabase client."""
-    return create_client(settings.supabase_url, settings.supabase_key)
+from src.database.repository import SUMMARY_COLUMNS, get_article_repository
 
 
 @tool("Search Articles")
@@ -19,57 +14,51 @@ def search_articles(
     status: Literal["draft", "published", "all"] = "all",
     limit: int = 20,
     offset: int = 0,
+    fields: Literal["summary", "full"] = "summary",
+    cursor: str | None = None,
+    count: Literal["exact", "planned", "estimated", "none"] | None = None,
 ) -> dict[str, Any]:
     """
     Search and list articles.
     
     Args:
-        keyword: Search in title and content (optional)
+        keyword: Search in title and content (optional). Results may be ordered by
+            relevance and carry a highlighted 'snippet' when full-text search is enabled.
         status: Filter by status - 'draft', 'published', or 'all' (default: 'all')
         limit: Maximum number of results (default: 20, max: 100)
-        offset: Number of results to skip (default: 0)
+        offset: Number of results to skip (default: 0). Prefer 'cursor' for later pages.
+        fields: 'summary' (id, title, excerpt, slug, status and dates) or 'full' for
+            complete rows including content (default: 'summary'). Prefer 'summary' and
+            use 'Read Article' with an ID when the full content is needed.
+        cursor: 'next_cursor' from a previous call to fetch the following page
+        count: How to compute 'total' - 'exact', 'planned' (fast estimate), 'estimated'
+            (exact for small results, otherwise planned) or 'none' (default: configured)
     
     Returns:
         Dictionary with articles list and count
     """
     try:
-        supabase = get_supabase()
-        
-        # Start query
-        query = supabase.table("news").select("*", count="exact")
-        
-        # Filter by status
-        if status == "draft":
-            query = query.eq("draft", True)
-        elif status == "published":
-            query = query.eq("draft", False)
-        
-        # Search by keyword
-        if keyword:
-            # Using ilike for case-insensitive search
-            # Note: logical OR in PostgREST is done via .or_() filter or raw string
-            # We'll use a simpler approach: direct filter if keyword provided
-            # For complex OR search (title OR content), we use the .or_ syntax:
-            # filter.or_(f"news_title.ilike.%{keyword}%,newscontent.ilike.%{keyword}%")
-            search_filter = f"news_title.ilike.%{keyword}%,newscontent.ilike.%{keyword}%"
-            query = query.or_(search_filter)
-        
-        # Ordering
-        query = query.order("created_at", desc=True)
-        
-        # Limits
         limit = min(limit, 100)
-        query = query.range(offset, offset + limit - 1)
-        
-        result = query.execute()
+        articles, total, next_cursor = get_article_repository().search(
+            keyword=keyword,
+            status=status,
+            limit=limit,
+            offset=offset,
+            mode=settings.search_mode,
+            columns=SUMMARY_COLUMNS if fields == "summary" else None,
+            cursor=cursor,
+            count=count or settings.list_count_mode,
+        )
         
         return {
             "success": True,
-            "articles": result.data,
-            "count": len(result.data),
-            "total": result.count,
+            "articles": articles,
+            "count": len(articles),
+            "total": total,
             "limit": limit,
             "offset": offset,
+            "fields": fields,
+            "next_cursor": next_cursor,
         }
         
     except Exception as e:
@@ -96,7 +85,7 @@ def list_articles(
         Dictionary with articles list
     """
     # Call the run method of the tool since it's decorated
-    return search_articles.run(keyword=None, status=status, limit=limit, offset=0)
+    return search_articles.run(keyword=None, status=status, limit=limit, offset=0, fields="summary")
 
 
 __all__ = ["search_articles", "list_articles"]
@@ -1,6 +1,8 @@
 from typing import Any, Dict, Optional
 import json
+import uuid
 from crewai.tools import tool
+from src.config.settings import settings
 from src.tools.slack import get_slack_client
 
 @tool("Ask Confirmation")
@@ -14,6 +16,9 @@ def ask_confirmation(
     """
     Ask for user confirmation before performing a regular action.
     ALWAYS use this instead of calling 'Create Article', 'Update Article', 'Delete Article', or 'Publish Article' directly.
+    For bulk requests, call this ONCE with a bulk tool ('Bulk Publish', 'Bulk Unpublish',
+    'Bulk Delete', 'Bulk Update') and all article_ids, listing every affected title in the
+    summary.
     
     Args:
         tool_name: The name of the tool you would like to execute (e.g., 'Create Article').
@@ -25,11 +30,16 @@ def ask_confirmation(
     Returns:
         A message indicating that confirmation has been requested.
     """
+    # Imported here: src.agents imports the tools package, so a module-level import would be circular
+    from src.agents.state import state_manager
+
     # 1. Save state
     pending_data = {
         "tool_name": tool_name.replace(" ", "_").lower(), # Normalize to snake_case if agent passes "Create Article"
         "tool_args": tool_args,
-        "summary": summary
+        "summary": summary,
+        # Passed to Create Article on approval (IDEMPOTENT_CREATES), so a retry can't write twice
+        "idempotency_key": uuid.uuid4().hex,
     }
     
     # Mapping friendly names to actual function names if needed
@@ -44,7 +54,7 @@ def ask_confirmation(
     if not client:
         return "Error: Slack not configured."
 
-    preview_url = f"http://localhost:8000/preview/pending/{thread_ts}"
+    preview_url = f"{settings.dashboard_url}/preview/pending/{thread_ts}"
     
     blocks = [
         {
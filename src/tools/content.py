@@ -5,9 +5,13 @@ from typing import Any
 
 from crewai.tools import tool
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
-
+from src.config.llm import llm_client, model_router
 from src.config.settings import settings
+from src.utils.llm_cache import get_response_cache, normalize
+from src.utils.semantic_cache import get_semantic_cache
+from src.utils.slack_stream import SlackMessageStream, stream_target
+
+TEMPERATURE = 0.7
 
 
 @tool("Generate Content")
@@ -16,6 +20,7 @@ def generate_content(
     tone: str = "inspiring",
     length: str = "medium",
     specific_details: list[str] | None = None,
+    regenerate: bool = False,
 ) -> dict[str, Any]:
     """
     Generate article content (headline, body, excerpt) using AI.
@@ -25,25 +30,20 @@ def generate_content(
         tone: Tone of writing (default: 'inspiring')
         length: Article length - 'short', 'medium', 'long' (default: 'medium')
         specific_details: Optional list of facts or details to include
+        regenerate: True to write a fresh draft even if this exact request was generated
+            before (use when the user asks to regenerate or try again)
     
     Returns:
         Dictionary with title, content, and excerpt
     """
-    # Create a dedicated LLM client for generation to ensure correct model name
-    # (CrewAI needs a prefix that OpenRouter rejects)
-    model = settings.default_model
+    # Use a dedicated LLM client for generation to ensure correct model name
+    # (CrewAI needs a prefix that OpenRouter rejects); it is built once and reused
+    model = model_router.model_for("tool", "generate_content")
     if model.startswith("openrouter/"):
         model = model.replace("openrouter/", "")
         
-    llm = ChatOpenAI(
-        model=model,
-        api_key=settings.openai_api_key,
-        base_url="https://openrouter.ai/api/v1",
-        temperature=0.7,
-        default_headers={
-            "HTTP-Referer": "https://github.com/singforhope/newsletter-manager",
-            "X-Title": "Newsletter Manager",
-        },
+    llm = llm_client.get_chat_model(
+        purpose="content", provider="openrouter", model=model, temperature=TEMPERATURE
     )
     
     # Construct details string
@@ -86,9 +86,59 @@ Format:
         HumanMessage(content=prompt_text)
     ]
     
+    # Same topic, tone, length and details as an earlier request -> reuse that draft
+    cache = get_response_cache()
+    cache_key = cache.key(model, TEMPERATURE, messages) if cache else None
+    if cache:
+        cached = cache.lookup(cache_key, bypass=regenerate)
+        if cached is not None:
+            return {
+                "success": True,
+                "data": cached,
+                "cached": True,
+                "message": f"Generated content for '{topic}' (reused an earlier draft)"
+            }
+    
+    # A paraphrase of an earlier request (same model, tone, length, numbers and dates,
+    # same terms) -> reuse that draft
+    semantic = get_semantic_cache()
+    request_text = " ".join([topic, *(specific_details or [])])
+    partition = f"{model}|{TEMPERATURE}|{normalize(tone)}|{normalize(length)}"
+    if semantic and not regenerate:
+        match = semantic.lookup(request_text, partition)
+        if match is not None:
+            similarity, similar_request, cached = match
+            return {
+                "success": True,
+                "data": cached,
+                "cached": True,
+                "message": (
+                    f"Generated content for '{topic}' (reused the draft for a similar request: "
+                    f"'{similar_request}', similarity {similarity:.2f})"
+                )
+            }
+    
+    raw = ""
+    stream = None
     try:
-        response = llm.invoke(messages)
-        content = response.content
+        # Inside a Slack request, stream the draft into the thread as it is written
+        target = stream_target.get()
+        if target and settings.stream_generation:
+            from src.tools.slack import get_slack_client
+
+            client = get_slack_client()
+            if client:
+                stream = SlackMessageStream(
+                    client, *target, interval=settings.stream_update_interval
+                )
+        
+        if stream:
+            for chunk in llm.stream(messages):
+                stream.append(chunk.content or "")
+            raw = stream.finish()
+        else:
+            raw = llm.invoke(messages).content
+        content = raw
         
         # Clean potential markdown formatting from LLM
         if content.startswith("```json"):
@@ -97,6 +147,10 @@ Format:
             content = content.replace("```", "")
             
         result = json.loads(content.strip())
+        if cache:
+            cache.store(cache_key, result)
+        if semantic:
+            semantic.add(request_text, result, partition)
         
         return {
             "success": True,
@@ -105,12 +159,16 @@ Format:
         }
         
     except json.JSONDecodeError:
+        if stream:
+            stream.fail("Draft generation failed: the AI response was not valid JSON")
         return {
             "success": False,
             "error": "JSON Parse Error",
-            "message": "Failed to parse AI response. Raw output: " + str(response.content)[:200]
+            "message": "Failed to parse AI response. Raw output: " + str(raw)[:200]
         }
     except Exception as e:
+        if stream:
+            stream.fail(f"Draft generation failed: {e}")
         return {
             "success": False,
             "error": str(e),
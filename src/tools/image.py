@@ -5,19 +5,12 @@ from typing import Any
 from crewai.tools import tool
 from openai import OpenAI
 
-from src.config.settings import settings
+from src.config.llm import llm_client
 
 
 def get_image_client() -> OpenAI:
-    """Get OpenAI client configured for OpenRouter."""
-    return OpenAI(
-        api_key=settings.openai_api_key,
-        base_url="https://openrouter.ai/api/v1",
-        default_headers={
-            "HTTP-Referer": "https://github.com/singforhope/newsletter-manager",
-            "X-Title": "Newsletter Manager",
-        },
-    )
+    """Get the shared OpenAI client configured for OpenRouter."""
+    return llm_client.get_openai_client(purpose="image", provider="openrouter")
 
 
 @tool("Generate Image")
@@ -1,7 +1,7 @@
 from langchain.tools import tool
 import base64
 import os
-from src.config.llm import get_llm
+from src.config.llm import get_llm, model_router
 from langchain_core.messages import HumanMessage
 
 @tool("Analyze Image")
@@ -21,7 +21,7 @@ def analyze_image(image_path: str, prompt: str = "Describe this image in detail.
             image_data = base64.b64encode(image_file.read()).decode("utf-8")
             
         # Create multimodal message for Claude/OpenAI
-        llm = get_llm()
+        llm = get_llm(model_router.tier("tool", "analyze_image"))
         
         # Check if model supports vision (Claude Sonnet does)
         # Create LangChain compatible message
@@ -1,5 +1,7 @@
 """Utility modules for the application."""
 
+from src.utils.journal import JsonlJournal
 from src.utils.temp_file_manager import temp_file_manager, TempFileManager
+from src.utils.worker_pool import KeyedWorkerPool
 
-__all__ = ['temp_file_manager', 'TempFileManager']
+__all__ = ['JsonlJournal', 'KeyedWorkerPool', 'temp_file_manager', 'TempFileManager']
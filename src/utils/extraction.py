@@ -0,0 +1,264 @@
+"""
+Document text extraction.
+Parses PDF and DOCX uploads in a process pool so CPU-bound parsing neither blocks the
+Slack worker threads nor holds their GIL. Large PDFs are split into page ranges that are
+parsed in parallel and reassembled in page order.
+
+Extraction works against a character budget: pages and paragraphs are read in order and
+parsing stops once the budget is filled, instead of parsing everything and cutting it.
+"""
+
+import io
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, List, Optional
+from xml.etree import ElementTree
+
+from src.config.settings import settings
+
+logger = logging.getLogger("Extraction")
+
+_executor: ProcessPoolExecutor | None = None
+_lock = threading.Lock()
+
+
+@dataclass
+class Extraction:
+    """Text pulled from a document, and how much of the document it covers."""
+
+    text: str
+    included: int  # leading pages (PDF), paragraphs (DOCX) or characters (text) read
+    total: Optional[int]  # size of the whole document in the same unit, if known
+    unit: str = "page"
+    truncated: bool = False
+
+    def note(self) -> str:
+        """Human-readable coverage, e.g. 'pages 1-37 of 500'."""
+        if self.unit == "page":
+            pages = "page 1" if self.included == 1 else f"pages 1-{self.included}"
+            return f"{pages} of {self.total}" if self.total else pages
+        of = f" of {self.total:,}" if self.total else ""
+        return f"the first {self.included:,}{of} {self.unit}s"
+
+
+def truncate_text(text: str, budget: Optional[int] = None) -> Extraction:
+    """Budget plain text the same way as documents (counted in characters)."""
+    budget = budget or settings.extraction_char_budget
+    if len(text) <= budget:
+        return Extraction(text, len(text), len(text), unit="character")
+    return Extraction(text[:budget], budget, len(text), unit="character", truncated=True)
+
+
+@lru_cache(maxsize=4)
+def _pdf_reader(path: str):
+    """Parsed PDF at `path`, reused by every range this worker reads from it.
+
+    Each extraction writes its PDF to a new temp file, so a path is never reused for
+    other bytes; the reader holds the document in memory once the file is read.
+    """
+    from pypdf import PdfReader
+
+    return PdfReader(path)
+
+
+def _pdf_pages(path: str, start: int, end: int, budget: int) -> List[str]:
+    """Text of pages [start, end) of a PDF, stopping once `budget` chars are read.
+
+    Runs in a worker process.
+    """
+    reader = _pdf_reader(path)
+    pages, used = [], 0
+    for i in range(start, end):
+        text = reader.pages[i].extract_text() or ""
+        pages.append(text)
+        used += len(text) + 1
+        if used >= budget:
+            break
+    return pages
+
+
+def _pdf_page_count(path: str) -> int:
+    return len(_pdf_reader(path).pages)
+
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _heading_level(style: Optional[str]) -> int:
+    """Markdown heading depth for a paragraph style id (0 for body text)."""
+    if not style:
+        return 0
+    if style == "Title":
+        return 1
+    if style.startswith("Heading") and style[7:].isdigit():
+        return min(int(style[7:]) + 1, 6)
+    return 0
+
+
+def iter_docx_blocks(content: bytes) -> Iterator[str]:
+    """Yield the text of a DOCX body block by block, in document order.
+
+    Streams word/document.xml with iterparse instead of building python-docx's object
+    graph, and clears each block once read, so memory stays flat on large documents.
+    Paragraphs come out as lines (headings prefixed with '#'), and each table row as
+    one ' | '-joined line.
+    """
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        with archive.open("word/document.xml") as xml:
+            depth = 0
+            body = None
+            runs: List[List[str]] = []  # text of each open paragraph (text boxes nest them)
+            styles: List[Optional[str]] = []
+            cells: List[List[str]] = []  # one list of cell texts per open table row
+            cell: List[List[str]] = []  # paragraphs of each open table cell
+
+            for event, elem in ElementTree.iterparse(xml, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    depth += 1
+                    if tag == f"{W}body":
+                        body = elem
+                    elif tag == f"{W}p":
+                        runs.append([])
+                        styles.append(None)
+                    elif tag == f"{W}tr":
+                        cells.append([])
+                    elif tag == f"{W}tc":
+                        cell.append([])
+                    continue
+
+                depth -= 1
+                if tag == f"{W}t" and runs:
+                    runs[-1].append(elem.text or "")
+                elif tag == f"{W}tab" and runs:
+                    runs[-1].append("\t")
+                elif tag in (f"{W}br", f"{W}cr") and runs:
+                    runs[-1].append("\n")
+                elif tag == f"{W}pStyle" and styles:
+                    styles[-1] = elem.get(f"{W}val")
+                elif tag == f"{W}p":
+                    text = "".join(runs.pop())
+                    style = styles.pop()
+                    if cell:
+                        cell[-1].append(text)
+                    else:
+                        level = _heading_level(style)
+                        yield f"{'#' * level} {text}" if level and text else text
+                elif tag == f"{W}tc":
+                    text = " ".join(t for t in cell.pop() if t)
+                    cells[-1].append(text)
+                elif tag == f"{W}tr":
+                    row = " | ".join(cells.pop())
+                    if cell:
+                        cell[-1].append(row)  # nested table: the row belongs to the outer cell
+                    else:
+                        yield row
+
+                # A body-level block (paragraph or table) is done: drop it from the tree
+                if depth == 2 and body is not None:
+                    body.remove(elem)
+
+
+def _docx_text(content: bytes, budget: int) -> Extraction:
+    """DOCX text up to `budget` chars, stopping the XML walk there (runs in a worker)."""
+    text, used = [], 0
+    blocks = iter_docx_blocks(content)
+    for block in blocks:
+        if used >= budget:
+            blocks.close()
+            joined = "".join(text)
+            return Extraction(joined[:budget], len(text), None, unit="paragraph", truncated=True)
+        text.append(block + "\n")
+        used += len(block) + 1
+
+    joined = "".join(text)
+    return Extraction(
+        joined[:budget], len(text), len(text), unit="paragraph", truncated=len(joined) > budget
+    )
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """Shared extraction pool, started on first use."""
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            # spawn, not fork: the bot is multi-threaded and forking it can copy held locks
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.extraction_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def extract_pdf(content: bytes, budget: Optional[int] = None) -> Extraction:
+    """Extract PDF text up to `budget` chars, parsing page ranges in parallel.
+
+    Only as many ranges as there are workers are in flight; once the pages read so far
+    fill the budget, later ranges are never parsed. The PDF goes to the workers once,
+    as a temp file each worker parses a single time, rather than pickled into every task.
+    """
+    budget = budget or settings.extraction_char_budget
+    executor = get_executor()
+    timeout = settings.extraction_timeout
+    chunk = max(1, settings.extraction_pages_per_task)
+
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    in_flight = deque()
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        pages = executor.submit(_pdf_page_count, path).result(timeout=timeout)
+        starts = deque(range(0, pages, chunk))
+
+        def submit_next():
+            start = starts.popleft()
+            end = min(start + chunk, pages)
+            in_flight.append(executor.submit(_pdf_pages, path, start, end, budget))
+
+        while starts and len(in_flight) < settings.extraction_workers:
+            submit_next()
+
+        text, used = [], 0
+        while in_flight and used < budget:
+            for page in in_flight.popleft().result(timeout=timeout):
+                text.append(page + "\n")
+                used += len(page) + 1
+                if used >= budget:
+                    break
+            if starts and used < budget:
+                submit_next()
+    finally:
+        # Budget filled, timed out or failed: don't leave ranges queued in the pool
+        for future in in_flight:
+            future.cancel()
+        os.unlink(path)
+
+    joined = "".join(text)
+    truncated = len(text) < pages or len(joined) > budget
+    return Extraction(joined[:budget], len(text), pages, truncated=truncated)
+
+
+def extract_docx(content: bytes, budget: Optional[int] = None) -> Extraction:
+    """Extract DOCX paragraph text up to `budget` chars in a worker process."""
+    budget = budget or settings.extraction_char_budget
+    future = get_executor().submit(_docx_text, content, budget)
+    return future.result(timeout=settings.extraction_timeout)
+
+
+def shutdown_executor():
+    """Stop the worker processes (e.g. at shutdown)."""
+    global _executor
+
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(cancel_futures=True)
+            _executor = None
@@ -0,0 +1,226 @@
+"""
+Extraction cache.
+Keeps the text extracted from uploaded files on local disk, content-addressed by the
+SHA-256 of the file, with an alias per Slack file id. A file referenced again by id
+skips both download and parse; a re-upload of the same bytes skips the parse. The
+directory is bounded in size and evicts least recently used entries.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.config.settings import settings
+from src.utils.extraction import Extraction
+
+logger = logging.getLogger("ExtractionCache")
+
+# Slack file ids look like F0123ABCD; anything else is not used as a filename
+FILE_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class ExtractionCache:
+    """Size-bounded LRU of extractions on disk.
+
+    Layout: `<dir>/<sha256>.json` holds one extraction; `<dir>/by-id/<file_id>` holds the
+    digest that file id resolved to. Recency is the entry's mtime, so it survives restarts.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.ids = self.directory / "by-id"
+        self.ids.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # digest -> entry size in bytes, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @staticmethod
+    def digest(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def _path(self, digest: str) -> Path:
+        return self.directory / f"{digest}.json"
+
+    def _load(self):
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, digest, size in sorted(entries):
+            self._entries[digest] = size
+            self._size += size
+
+        # Drop aliases whose entry was evicted by another process
+        for alias in self.ids.iterdir():
+            try:
+                if alias.read_text().strip() not in self._entries:
+                    alias.unlink()
+            except OSError:
+                pass
+        logger.info(
+            f"Extraction cache: {len(self._entries)} entries, "
+            f"{self._size / 1024 / 1024:.1f}MB in {self.directory}"
+        )
+
+    def _read(self, digest: str, budget: int) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(digest), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Text extracted under a different budget covers a different part of the file
+        if entry.get("budget") != budget:
+            return None
+        return entry
+
+    def _touch(self, digest: str):
+        try:
+            os.utime(self._path(digest))
+        except OSError:
+            pass
+        with self._lock:
+            if digest in self._entries:
+                self._entries.move_to_end(digest)
+
+    def _write_json(self, path: Path, data: Any):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _alias(self, file_id: Optional[str], digest: str):
+        if file_id and FILE_ID.match(file_id):
+            (self.ids / file_id).write_text(digest)
+
+    def get_by_file_id(
+        self, file_id: Optional[str], size: Optional[int] = None
+    ) -> Optional[Extraction]:
+        """Look up a Slack file seen before, without downloading it."""
+        if not file_id or not FILE_ID.match(file_id):
+            return None
+        try:
+            digest = (self.ids / file_id).read_text().strip()
+        except OSError:
+            self.misses += 1
+            return None
+        entry = self._read(digest, settings.extraction_char_budget)
+        # Slack reports the size up front; a mismatch means the id now points at other bytes
+        if entry is None or (size and entry.get("size") != size):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touch(digest)
+        return Extraction(**entry["extraction"])
+
+    def get(self, digest: str, file_id: Optional[str] = None) -> Optional[Extraction]:
+        """Look up downloaded bytes by digest, remembering `file_id` for next time."""
+        entry = self._read(digest, settings.extraction_char_budget)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touch(digest)
+        if file_id and file_id not in entry.get("file_ids", []):
+            self._alias(file_id, digest)
+            entry["file_ids"] = entry.get("file_ids", []) + [file_id]
+            self._write_json(self._path(digest), entry)
+        return Extraction(**entry["extraction"])
+
+    def put(
+        self,
+        digest: str,
+        extraction: Extraction,
+        size: int,
+        file_id: Optional[str] = None,
+        name: Optional[str] = None,
+    ):
+        """Store an extraction, then evict old entries beyond the size limit."""
+        entry = {
+            "digest": digest,
+            "size": size,
+            "budget": settings.extraction_char_budget,
+            "name": name,
+            "file_ids": [file_id] if file_id else [],
+            "created_at": datetime.now().isoformat(),
+            "extraction": asdict(extraction),
+        }
+        path = self._path(digest)
+        self._write_json(path, entry)
+        self._alias(file_id, digest)
+        stored = path.stat().st_size
+
+        with self._lock:
+            self._size += stored - self._entries.pop(digest, 0)
+            self._entries[digest] = stored
+            evicted = []
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                old, old_size = self._entries.popitem(last=False)
+                self._size -= old_size
+                evicted.append(old)
+
+        for old in evicted:
+            self._evict(old)
+
+    def _evict(self, digest: str):
+        path = self._path(digest)
+        try:
+            with open(path, encoding="utf-8") as f:
+                file_ids = json.load(f).get("file_ids", [])
+        except (OSError, ValueError):
+            file_ids = []
+        for file_id in file_ids:
+            if FILE_ID.match(file_id):
+                (self.ids / file_id).unlink(missing_ok=True)
+        path.unlink(missing_ok=True)
+        logger.info(f"Evicted extraction {digest[:12]}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+_cache: ExtractionCache | None = None
+_lock = threading.Lock()
+
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """Process-wide cache, or None when `settings.extraction_cache_enabled` is off."""
+    global _cache
+
+    if not settings.extraction_cache_enabled:
+        return None
+    with _lock:
+        if _cache is None:
+            _cache = ExtractionCache(
+                settings.extraction_cache_dir, settings.extraction_cache_max_mb * 1024 * 1024
+            )
+        return _cache
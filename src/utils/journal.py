@@ -0,0 +1,185 @@
+"""
+Append-only JSON Lines journal.
+Each write appends a single record instead of rewriting the whole file; the file is
+compacted in the background once dead records outweigh live ones.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, so no multi-process check
+    fcntl = None
+
+logger = logging.getLogger("Journal")
+
+# Called under the journal lock once a compacted file is in place. Takes an offset in
+# the old file and returns its offset in the new one (None if the record was dropped).
+Relocate = Callable[[int], Optional[int]]
+
+
+class JsonlJournal:
+    """Append-only JSONL file addressed by byte offset, with background compaction.
+
+    Callers keep an index of the offsets they still need (returned by `append`) and
+    read records back with `read`. To compact, they pass those offsets together with
+    `position()` to `compact_async()`; the live records are copied into a new file,
+    records appended in the meantime are carried over, and `on_swap` gets a function
+    to translate old offsets into new ones before any other reader sees the new file.
+
+    `lock` may be shared with the caller (it must then be an RLock) so that index
+    updates and journal writes happen atomically.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        compact_min_records: int = 1000,
+        compact_ratio: float = 2.0,
+        lock: Optional[ContextManager] = None,
+    ):
+        self.path = path
+        self.compact_min_records = compact_min_records
+        self.compact_ratio = compact_ratio
+        self.record_count = 0
+        self._lock = lock or threading.RLock()
+        self._compacting = False
+        # Binary mode so file offsets are plain byte positions
+        self._file = open(self.path, "ab")
+        self._owner = self._claim()
+
+    def _claim(self):
+        """Take an advisory lock, warning if another process already writes this journal.
+
+        Each process only sees its own appends, so sharing a journal silently diverges.
+        """
+        if fcntl is None:
+            return None
+        handle = open(f"{self.path}.lock", "a")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            logger.warning(
+                f"{self.path} is already open in another process. File-backed state is "
+                "single-process; set STATE_BACKEND=sqlite or redis to share it."
+            )
+        return handle
+
+    @staticmethod
+    def _encode(record: Dict[str, Any]) -> bytes:
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        return (line + "\n").encode("utf-8")
+
+    def replay(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield `(offset, record)` in file order, skipping a torn or corrupt line."""
+        count = 0
+        offset = 0
+        with open(self.path, "rb") as f:
+            for line_no, line in enumerate(f, 1):
+                start, offset = offset, offset + len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt journal line {line_no} in {self.path}")
+                    continue
+                count += 1
+                yield start, record
+        self.record_count = count
+
+    def read(self, offsets: Iterable[int]) -> List[Dict[str, Any]]:
+        """Read the records stored at `offsets`."""
+        with self._lock, open(self.path, "rb") as f:
+            records = []
+            for offset in offsets:
+                f.seek(offset)
+                records.append(json.loads(f.readline()))
+            return records
+
+    def append(self, record: Dict[str, Any]) -> int:
+        """Append one record and return its offset. Cost is independent of the journal size."""
+        line = self._encode(record)
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(line)
+            self._file.flush()
+            self.record_count += 1
+            return offset
+
+    def position(self) -> int:
+        """Current end-of-file offset, to pair with a set of live offsets for compaction."""
+        with self._lock:
+            self._file.flush()
+            return self._file.tell()
+
+    def needs_compaction(self, live_records: int) -> bool:
+        """True when the journal holds many more records than are live."""
+        if self._compacting or self.record_count < self.compact_min_records:
+            return False
+        return self.record_count > live_records * self.compact_ratio
+
+    def compact_async(self, offsets: List[int], position: int, on_swap: Callable[[Relocate], None]):
+        """Rewrite the journal keeping only `offsets` (all below `position`) in the background."""
+        with self._lock:
+            if self._compacting:
+                return
+            self._compacting = True
+        threading.Thread(
+            target=self._compact,
+            args=(offsets, position, on_swap),
+            name="journal-compaction",
+            daemon=True,
+        ).start()
+
+    def _compact(self, offsets: List[int], position: int, on_swap: Callable[[Relocate], None]):
+        tmp_path = f"{self.path}.compact"
+        try:
+            moved: Dict[int, int] = {}
+            # Everything below `position` is immutable until the swap, so copying the
+            # live records needs no lock
+            with open(tmp_path, "wb") as out, open(self.path, "rb") as old:
+                for offset in sorted(offsets):
+                    old.seek(offset)
+                    moved[offset] = out.tell()
+                    out.write(old.readline())
+                base = out.tell()
+
+                with self._lock:
+                    self._file.flush()
+                    old.seek(position)
+                    tail = old.read()
+                    out.write(tail)
+                    out.flush()
+                    os.fsync(out.fileno())
+
+                    self._file.close()
+                    os.replace(tmp_path, self.path)
+                    self._file = open(self.path, "ab")
+                    self.record_count = len(moved) + tail.count(b"\n")
+
+                    def relocate(offset: int) -> Optional[int]:
+                        if offset >= position:
+                            return offset - position + base
+                        return moved.get(offset)
+
+                    on_swap(relocate)
+
+            logger.info(f"Compacted {self.path} to {self.record_count} records")
+        except Exception as e:
+            logger.error(f"Failed to compact {self.path}: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        finally:
+            self._compacting = False
+
+    def close(self):
+        """Close the underlying file."""
+        with self._lock:
+            self._file.close()
+            if self._owner is not None:
+                self._owner.close()
@@ -0,0 +1,259 @@
+"""
+LLM response cache.
+Remembers generations keyed on the normalized prompt, model and temperature, so asking
+for the same draft again in a thread returns in milliseconds instead of a paid round
+trip. Opt-in via `settings.llm_cache_backend`; entries expire after a TTL and the store
+is bounded in size, evicting least recently used entries first.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Sequence
+
+from src.config.settings import settings
+
+logger = logging.getLogger("LLMCache")
+
+
+def normalize(text: str) -> str:
+    """Case- and whitespace-insensitive form of a prompt."""
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+class ResponseCache(ABC):
+    """Key/value store of LLM results with TTL, a size cap and hit counters."""
+
+    def __init__(self, ttl: float, max_bytes: int):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    @staticmethod
+    def key(model: str, temperature: float, messages: Sequence[Any]) -> str:
+        """Cache key for a chat request; messages are LangChain messages or plain strings."""
+        parts = [
+            normalize(getattr(message, "content", message) or "") for message in messages
+        ]
+        raw = json.dumps({"model": model, "temperature": temperature, "messages": parts})
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str, bypass: bool = False) -> Optional[Any]:
+        """`get` that keeps hit/miss counts; `bypass` (regenerate) always misses."""
+        if bypass:
+            with self._stats_lock:
+                self.bypassed += 1
+            return None
+        try:
+            value = self.get(key)
+        except Exception as e:
+            logger.error(f"LLM cache read failed: {e}")
+            value = None
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def store(self, key: str, value: Any):
+        """`set` that never fails the caller."""
+        try:
+            self.set(key, value)
+        except Exception as e:
+            logger.error(f"LLM cache write failed: {e}")
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if absent or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any):
+        """Store a JSON-serialisable value and evict beyond `max_bytes`."""
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": type(self).__name__,
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Cache in a local SQLite file (WAL), shared by the processes on one host."""
+
+    def __init__(self, path: str, ttl: float, max_bytes: int):
+        super().__init__(ttl, max_bytes)
+        self.path = path
+        self._local = threading.local()
+        self._conn().execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn().execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed_at ON llm_cache (accessed_at)"
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            from src.agents.state_backends import connect_sqlite
+
+            conn = self._local.conn = connect_sqlite(self.path)
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT value FROM llm_cache WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        now = time.time()
+        raw = json.dumps(value)
+        conn = self._conn()
+        conn.execute(
+            "INSERT INTO llm_cache (key, value, size, expires_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+            "size = excluded.size, expires_at = excluded.expires_at, "
+            "accessed_at = excluded.accessed_at",
+            (key, raw, len(raw), now + self.ttl, now),
+        )
+        # Drop expired rows, then everything past max_bytes counting from the most recent
+        conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+        conn.execute(
+            "DELETE FROM llm_cache WHERE key IN ("
+            " SELECT key FROM ("
+            "  SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS running"
+            "  FROM llm_cache"
+            " ) WHERE running > ?"
+            ")",
+            (self.max_bytes,),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        entries, size = self._conn().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()
+        stats.update(entries=entries, bytes=size, max_bytes=self.max_bytes)
+        return stats
+
+
+class RedisResponseCache(ResponseCache):
+    """Cache in Redis, shared by every process.
+
+    Entries expire natively (EX). A sorted set orders keys by last access and a hash
+    records their sizes, so the least recently used are evicted past `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_bytes: int,
+        url: str | None = None,
+        client: Any = None,
+        prefix: str = "sfh:llm_cache",
+    ):
+        super().__init__(ttl, max_bytes)
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(url or settings.redis_url)
+        self.client = client
+        self.prefix = prefix
+        self._lru = f"{prefix}:lru"
+        self._sizes = f"{prefix}:sizes"
+        self._total = f"{prefix}:bytes"
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self._key(key))
+        if raw is None:
+            return None
+        self.client.zadd(self._lru, {key: time.time()})
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any):
+        raw = json.dumps(value)
+        previous = int(self.client.hget(self._sizes, key) or 0)
+        pipe = self.client.pipeline()
+        pipe.set(self._key(key), raw, ex=int(self.ttl))
+        pipe.zadd(self._lru, {key: time.time()})
+        pipe.hset(self._sizes, key, len(raw))
+        pipe.incrby(self._total, len(raw) - previous)
+        pipe.execute()
+        self._evict()
+
+    def _evict(self):
+        # Keys that already expired still count until they reach the front and are popped
+        while int(self.client.get(self._total) or 0) > self.max_bytes:
+            popped = self.client.zpopmin(self._lru)
+            if not popped:
+                break
+            key = popped[0][0]
+            key = key.decode() if isinstance(key, bytes) else key
+            size = int(self.client.hget(self._sizes, key) or 0)
+            pipe = self.client.pipeline()
+            pipe.delete(self._key(key))
+            pipe.hdel(self._sizes, key)
+            pipe.decrby(self._total, size)
+            pipe.execute()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats.update(
+            entries=self.client.zcard(self._lru),
+            bytes=int(self.client.get(self._total) or 0),
+            max_bytes=self.max_bytes,
+        )
+        return stats
+
+
+_cache: ResponseCache | None = None
+_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Process-wide cache selected by `settings.llm_cache_backend`; None when "off"."""
+    global _cache
+
+    name = settings.llm_cache_backend.lower()
+    if name in ("", "off", "none"):
+        return None
+    with _lock:
+        if _cache is None:
+            ttl, max_bytes = settings.llm_cache_ttl, settings.llm_cache_max_mb * 1024 * 1024
+            if name == "sqlite":
+                _cache = SQLiteResponseCache(settings.llm_cache_db, ttl, max_bytes)
+            elif name == "redis":
+                _cache = RedisResponseCache(ttl, max_bytes)
+            else:
+                raise ValueError(f"Unsupported LLM cache backend: {settings.llm_cache_backend}")
+        return _cache
@@ -0,0 +1,211 @@
+"""
+Semantic response cache.
+Catches paraphrased Generate Content requests ("write about the piano launch" vs
+"draft an article on the pianos launch") that the exact-match cache misses. Requests
+are embedded with a hashed word + character n-gram vectorizer (no model download) and
+matched by cosine similarity against a NumPy index; entries above the threshold are
+reused. Numbers, amounts, dates and month names must match exactly, and every content
+word must have a counterpart (the same word or a near spelling) in the cached request:
+"May 5" vs "May 6", "$50,000" vs "$500,000" or "Bronx" vs "Brooklyn" are different
+requests however similar the rest of the wording. The index is in memory, bounded,
+and evicts the least recently used entry.
+"""
+
+import logging
+import re
+import threading
+import time
+import zlib
+from difflib import SequenceMatcher
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from src.config.settings import settings
+
+logger = logging.getLogger("SemanticCache")
+
+# Request boilerplate that says nothing about the subject
+STOPWORDS = frozenset(
+    "a an the and or of on in at to for about with by from into "
+    "write draft create generate make compose prepare give me us please this that our my your "
+    "article articles post story piece news newsletter blog announcement some new".split()
+)
+# Calendar words, which like numbers change the facts of a draft
+CALENDAR_WORDS = frozenset(
+    "january february march april may june july august september october november december "
+    "jan feb mar apr jun jul aug sep sept oct nov dec monday tuesday wednesday thursday "
+    "friday saturday sunday".split()
+)
+# How alike two words must be to count as the same term (typos, "theatre"/"theater")
+WORD_MATCH_RATIO = 0.8
+
+
+def exact_tokens(text: str) -> Tuple[str, ...]:
+    """Numbers (counts, amounts, years, dates) and calendar words in `text`, sorted.
+
+    Requests only match when these are identical.
+    """
+    text = text.lower()
+    numbers = [n.replace(",", "") for n in re.findall(r"\d(?:[\d,.:/-]*\d)?", text)]
+    words = [w for w in re.findall(r"[a-z]+", text) if w in CALENDAR_WORDS]
+    return tuple(sorted(numbers + words))
+
+
+class HashingVectorizer:
+    """Unit-length vectors from hashed words and character trigrams.
+
+    Words carry the topic; trigrams of each padded word ("#piano#") make small spelling
+    differences land close together.
+    """
+
+    def __init__(self, dim: int = 256, trigram_weight: float = 0.5):
+        self.dim = dim
+        self.trigram_weight = trigram_weight
+
+    @staticmethod
+    def _stem(word: str) -> str:
+        # Plural -> singular is the common paraphrase; no full stemmer needed
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            return word[:-1]
+        return word
+
+    def words(self, text: str) -> list:
+        """Content words of a request: lower-cased, stemmed, without boilerplate."""
+        return [
+            self._stem(w) for w in re.findall(r"[a-z0-9]+", text.lower()) if w not in STOPWORDS
+        ]
+
+    def features(self, text: str):
+        for word in self.words(text):
+            yield word, 1.0
+            padded = f"#{word}#"
+            for i in range(len(padded) - 2):
+                yield padded[i:i + 3], self.trigram_weight
+
+    def __call__(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature, weight in self.features(text):
+            h = zlib.crc32(feature.encode("utf-8"))
+            # One hash bit picks the sign so collisions cancel out instead of piling up
+            vector[h % self.dim] += weight if h & 0x80000000 else -weight
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class SemanticCache:
+    """Nearest-neighbour cache over a preallocated float32 matrix.
+
+    Each entry has a partition (e.g. model + tone + length) that must match exactly,
+    as must the text's `exact_tokens`; only the rest is compared by similarity, and the
+    best match is only reused if both requests use the same terms (`_same_terms`).
+    """
+
+    def __init__(self, threshold: float = 0.85, max_entries: int = 5000, dim: int = 256):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.vectorize = HashingVectorizer(dim)
+        self._lock = threading.Lock()
+        self._vectors = np.zeros((min(max_entries, 1024), dim), dtype=np.float32)
+        self._partitions = np.zeros(len(self._vectors), dtype=np.int64)
+        self._last_used = np.zeros(len(self._vectors), dtype=np.float64)
+        self._values: Dict[int, Tuple[str, Any]] = {}  # slot -> (text, value)
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _partition(partition: str, text: str) -> int:
+        key = "|".join([partition, *exact_tokens(text)])
+        return zlib.crc32(key.encode("utf-8"))
+
+    def _same_terms(self, text: str, other: str) -> bool:
+        """True if each content word of either request has a close match in the other."""
+        words, other_words = set(self.vectorize.words(text)), set(self.vectorize.words(other))
+
+        def covered(word: str, candidates: set) -> bool:
+            return word in candidates or any(
+                SequenceMatcher(None, word, c).ratio() >= WORD_MATCH_RATIO for c in candidates
+            )
+
+        return all(covered(w, other_words) for w in words) and all(
+            covered(w, words) for w in other_words
+        )
+
+    def lookup(self, text: str, partition: str = "") -> Optional[Tuple[float, str, Any]]:
+        """Best match above the threshold as (similarity, cached text, value), else None."""
+        query = self.vectorize(text)
+        with self._lock:
+            if self._size:
+                scores = self._vectors[: self._size] @ query
+                scores[self._partitions[: self._size] != self._partition(partition, text)] = -1.0
+                slot = int(np.argmax(scores))
+                score = float(scores[slot])
+                cached_text, value = self._values.get(slot, ("", None))
+                if score >= self.threshold and self._same_terms(text, cached_text):
+                    self._last_used[slot] = time.monotonic()
+                    self.hits += 1
+                    logger.info(f"Similar request ({score:.2f}): '{text}' ~ '{cached_text}'")
+                    return score, cached_text, value
+            self.misses += 1
+            return None
+
+    def add(self, text: str, value: Any, partition: str = ""):
+        """Index `value` under `text`, evicting the least recently used entry if full."""
+        vector = self.vectorize(text)
+        with self._lock:
+            if self._size < len(self._vectors):
+                slot = self._size
+                self._size += 1
+            elif self._size < self.max_entries:
+                self._grow()
+                slot = self._size
+                self._size += 1
+            else:
+                slot = int(np.argmin(self._last_used[: self._size]))
+            self._vectors[slot] = vector
+            self._partitions[slot] = self._partition(partition, text)
+            self._last_used[slot] = time.monotonic()
+            self._values[slot] = (text, value)
+
+    def _grow(self):
+        capacity = min(len(self._vectors) * 2, self.max_entries)
+        extra = capacity - len(self._vectors)
+        self._vectors = np.vstack(
+            [self._vectors, np.zeros((extra, self._vectors.shape[1]), dtype=np.float32)]
+        )
+        self._partitions = np.concatenate([self._partitions, np.zeros(extra, dtype=np.int64)])
+        self._last_used = np.concatenate([self._last_used, np.zeros(extra, dtype=np.float64)])
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": self._size,
+                "max_entries": self.max_entries,
+                "threshold": self.threshold,
+                "index_bytes": int(self._vectors.nbytes),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+_cache: SemanticCache | None = None
+_lock = threading.Lock()
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Process-wide cache, or None when `settings.semantic_cache_enabled` is off."""
+    global _cache
+
+    if not settings.semantic_cache_enabled:
+        return None
+    with _lock:
+        if _cache is None:
+            _cache = SemanticCache(
+                threshold=settings.semantic_cache_threshold,
+                max_entries=settings.semantic_cache_max_entries,
+                dim=settings.semantic_cache_dim,
+            )
+        return _cache
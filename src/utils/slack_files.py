@@ -0,0 +1,131 @@
+"""
+Slack file downloads.
+Fetches attachments concurrently over one pooled HTTP client, streaming each body and
+aborting as soon as it passes the size cap instead of buffering it first.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from src.config.settings import settings
+
+logger = logging.getLogger("SlackFiles")
+
+CHUNK_SIZE = 64 * 1024
+
+
+class DownloadError(Exception):
+    """A file could not be fetched (HTTP error or over the size cap)."""
+
+
+@dataclass
+class Download:
+    """Result of fetching one Slack file."""
+
+    file: Dict[str, Any]
+    content: Optional[bytes] = None
+    error: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)  # stage -> milliseconds
+
+
+_client: httpx.Client | None = None
+_executor: ThreadPoolExecutor | None = None
+_lock = threading.Lock()
+
+
+def max_file_bytes() -> int:
+    return settings.max_file_size_mb * 1024 * 1024
+
+
+def get_http_client() -> httpx.Client:
+    """Process-wide client for Slack file URLs; keeps connections alive between files."""
+    global _client
+
+    with _lock:
+        if _client is None:
+            _client = httpx.Client(
+                timeout=settings.file_download_timeout,
+                follow_redirects=True,
+                headers={"Authorization": f"Bearer {settings.slack_bot_token}"},
+                limits=httpx.Limits(
+                    max_connections=settings.file_download_concurrency,
+                    max_keepalive_connections=settings.file_download_concurrency,
+                ),
+            )
+        return _client
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared pool, so concurrent requests together stay within the download limit."""
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.file_download_concurrency,
+                thread_name_prefix="slack-download",
+            )
+        return _executor
+
+
+def fetch(url: str, max_bytes: int | None = None) -> bytes:
+    """Stream `url` into memory, giving up as soon as it exceeds `max_bytes`."""
+    max_bytes = max_bytes or max_file_bytes()
+    chunks = []
+    received = 0
+    with get_http_client().stream("GET", url) as response:
+        if response.status_code != 200:
+            raise DownloadError(f"HTTP {response.status_code}")
+        declared = response.headers.get("Content-Length")
+        if declared and int(declared) > max_bytes:
+            raise DownloadError(f"File too large (max {max_bytes // (1024 * 1024)}MB)")
+        for chunk in response.iter_bytes(CHUNK_SIZE):
+            received += len(chunk)
+            if received > max_bytes:
+                raise DownloadError(f"File too large (max {max_bytes // (1024 * 1024)}MB)")
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _download(file: Dict[str, Any]) -> Download:
+    result = Download(file=file)
+    start = time.perf_counter()
+    try:
+        result.content = fetch(file["url_private"])
+    except Exception as e:
+        result.error = str(e)
+    result.timings["download_ms"] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def download_files(files: List[Dict[str, Any]]) -> List[Download]:
+    """Download Slack files concurrently. Results come back in the order given."""
+    if not files:
+        return []
+    results = list(_get_executor().map(_download, files))
+    for result in results:
+        name = result.file.get("name")
+        if result.error:
+            logger.error(f"❌ Failed to download {name}: {result.error}")
+        else:
+            logger.info(
+                f"📥 Downloaded {name} ({len(result.content) / 1024:.1f}KB) "
+                f"in {result.timings['download_ms']:.0f}ms"
+            )
+    return results
+
+
+def close_http_client():
+    """Close the shared client (e.g. at shutdown)."""
+    global _client
+
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
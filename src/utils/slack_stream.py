@@ -0,0 +1,141 @@
+"""
+Streaming output to Slack.
+Shows text as it is generated in one Slack message, posted on the first output and then
+edited with throttled `chat_update` calls, so users see progress within about a second
+instead of waiting for the whole generation.
+
+Tools find out where to stream through `stream_target`, which the Slack handler sets to
+(channel_id, thread_ts) while it runs the agent; when it is unset nothing is streamed.
+"""
+
+import json
+import logging
+import re
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger("SlackStream")
+
+# Slack truncates long messages; keep edits well inside the limit
+MAX_MESSAGE_CHARS = 3500
+CURSOR = " ▌"
+
+stream_target: ContextVar[Optional[Tuple[str, str]]] = ContextVar("stream_target", default=None)
+
+
+def partial_json_fields(buffer: str, fields: Iterable[str]) -> Dict[str, str]:
+    """Read string fields out of a JSON object that may still be cut off mid-value."""
+    values = {}
+    for name in fields:
+        match = re.search(rf'"{name}"\s*:\s*"', buffer)
+        if not match:
+            continue
+        end, escaped = match.end(), False
+        while end < len(buffer):
+            char = buffer[end]
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                break
+            end += 1
+        raw = buffer[match.end():end]
+        # Drop a dangling escape ('\' or a partial '\u00') so the prefix decodes
+        raw = re.sub(r"\\(u[0-9a-fA-F]{0,3})?$", "", raw)
+        try:
+            values[name] = json.loads(f'"{raw}"')
+        except ValueError:
+            values[name] = raw
+    return values
+
+
+def render_draft(buffer: str, done: bool) -> str:
+    """Slack preview of a Generate Content response ({"title", "excerpt", "content"})."""
+    fields = partial_json_fields(buffer, ("title", "excerpt", "content"))
+    if not fields:
+        return "" if not done else buffer[:MAX_MESSAGE_CHARS]
+
+    header = "✍️ *Draft preview*" if done else "✍️ *Writing draft…*"
+    parts = [header]
+    if fields.get("title"):
+        parts.append(f"*{fields['title']}*")
+    if fields.get("excerpt"):
+        parts.append(f"_{fields['excerpt']}_")
+    content = fields.get("content", "")
+    budget = MAX_MESSAGE_CHARS - sum(len(part) for part in parts) - 10
+    if len(content) > budget:
+        # While streaming show the newest text; the full draft follows in the reply
+        content = "…" + content[-budget:] if not done else content[:budget] + "…"
+    if content:
+        parts.append(f"\n{content}")
+    text = "\n".join(parts)
+    return text if done else text + CURSOR
+
+
+class SlackMessageStream:
+    """Accumulates streamed text and mirrors it into a single Slack message."""
+
+    def __init__(
+        self,
+        client: Any,
+        channel: str,
+        thread_ts: str,
+        interval: float = 1.0,
+        render: Callable[[str, bool], str] = render_draft,
+    ):
+        self.client = client
+        self.channel = channel
+        self.thread_ts = thread_ts
+        self.interval = interval
+        self.render = render
+        self.text = ""
+        self.ts: Optional[str] = None
+        self.updates = 0
+        self.started = time.monotonic()
+        self.first_visible: Optional[float] = None  # seconds from start to first post
+        self._last_flush = float("-inf")
+        self._shown = ""
+        self._broken = False
+
+    def append(self, delta: str):
+        self.text += delta
+        if time.monotonic() - self._last_flush >= self.interval:
+            self._flush(done=False)
+
+    def finish(self) -> str:
+        """Show the final text (no cursor) and return everything streamed."""
+        self._flush(done=True)
+        return self.text
+
+    def fail(self, message: str):
+        """Replace the preview with an error note, if anything was posted."""
+        if self.ts and not self._broken:
+            self._send(f"⚠️ {message}")
+
+    def _flush(self, done: bool):
+        if self._broken:
+            return
+        text = self.render(self.text, done)
+        if not text.strip() or text == self._shown:
+            return
+        self._send(text)
+        self._last_flush = time.monotonic()
+
+    def _send(self, text: str):
+        try:
+            if self.ts is None:
+                response = self.client.chat_postMessage(
+                    channel=self.channel, thread_ts=self.thread_ts, text=text
+                )
+                self.ts = response["ts"]
+                self.first_visible = time.monotonic() - self.started
+            else:
+                self.client.chat_update(channel=self.channel, ts=self.ts, text=text)
+            self._shown = text
+            self.updates += 1
+        except Exception as e:
+            # A failed edit (e.g. rate limit) must not fail the generation itself
+            logger.warning(f"Stopped streaming to Slack: {e}")
+            self._broken = True
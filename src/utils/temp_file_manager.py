@@ -1,52 +1,119 @@
 """
 Temporary File Manager for Slack File Processing.
 Tracks and manages cleanup of temporary files created during file processing.
+
+Files are tracked per scope (the Slack thread_ts that produced them), so finishing one
+conversation only removes its own files. A background reaper removes anything older
+than `max_age`, and small files can be kept on a tmpfs (e.g. /dev/shm) instead of disk.
 """
 
 import logging
 import os
 import tempfile
-from typing import List, Optional
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
 from pathlib import Path
 import atexit
 
 logger = logging.getLogger("TempFileManager")
 
+# Scope for files created without one
+GLOBAL_SCOPE = "_global"
+
 
 class TempFileManager:
     """Manages temporary files with automatic cleanup tracking."""
     
-    def __init__(self):
-        """Initialize temp file manager."""
-        self._temp_files: List[str] = []
+    def __init__(
+        self,
+        max_age: Optional[float] = None,
+        reap_interval: float = 300,
+        memory_dir: Optional[str] = None,
+        memory_max_bytes: int = 0,
+    ):
+        """
+        Initialize temp file manager.
+        
+        Args:
+            max_age: Seconds after which the reaper deletes a file (None disables it)
+            reap_interval: Seconds between reaper passes
+            memory_dir: tmpfs directory for small files ("auto" picks /dev/shm if present)
+            memory_max_bytes: Files up to this size written by `write_temp_file` go to
+                `memory_dir`; larger ones go to the system temp dir
+        """
+        self._lock = threading.Lock()
+        # path -> (scope, created_at); scope -> paths. Both O(1) to update.
+        self._temp_files: Dict[str, Tuple[str, float]] = {}
+        self._scopes: Dict[str, Set[str]] = {}
+        self.max_age = max_age
+        self.reap_interval = reap_interval
+        self.memory_dir = self._resolve_memory_dir(memory_dir)
+        self.memory_max_bytes = memory_max_bytes if self.memory_dir else 0
+        self._reaper: Optional[threading.Thread] = None
         # Register cleanup on program exit
         atexit.register(self.cleanup_all)
     
-    def create_temp_file(self, suffix: str = "", prefix: str = "slack_") -> str:
+    @staticmethod
+    def _resolve_memory_dir(memory_dir: Optional[str]) -> Optional[str]:
+        if memory_dir == "auto":
+            memory_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        if memory_dir and not os.access(memory_dir, os.W_OK):
+            logger.warning(f"⚠️ Temp memory dir {memory_dir} is not writable, using disk")
+            return None
+        return memory_dir or None
+    
+    def _track(self, filepath: str, scope: Optional[str]):
+        scope = scope or GLOBAL_SCOPE
+        with self._lock:
+            self._temp_files[filepath] = (scope, time.time())
+            self._scopes.setdefault(scope, set()).add(filepath)
+        self._ensure_reaper()
+    
+    def _untrack(self, filepath: str):
+        with self._lock:
+            entry = self._temp_files.pop(filepath, None)
+            if entry:
+                paths = self._scopes.get(entry[0])
+                if paths is not None:
+                    paths.discard(filepath)
+                    if not paths:
+                        del self._scopes[entry[0]]
+    
+    def create_temp_file(
+        self, suffix: str = "", prefix: str = "slack_", scope: Optional[str] = None,
+        directory: Optional[str] = None,
+    ) -> str:
         """
         Create a temporary file and track it for cleanup.
         
         Args:
             suffix: File suffix (e.g., ".jpg", ".png")
             prefix: File prefix
-            
+            scope: Owner of the file, usually the Slack thread_ts
+            directory: Where to create it (default: the system temp dir)
+        
         Returns:
             Path to the created temporary file
         """
         tfile = tempfile.NamedTemporaryFile(
-            delete=False, 
-            suffix=suffix, 
-            prefix=prefix
+            delete=False,
+            suffix=suffix,
+            prefix=prefix,
+            dir=directory,
         )
         filepath = tfile.name
         tfile.close()
         
-        self._temp_files.append(filepath)
-        logger.info(f"📁 Created temp file: {filepath}")
+        self._track(filepath, scope)
+        logger.info(f"📁 Created temp file: {filepath} (scope {scope or GLOBAL_SCOPE})")
         
         return filepath
     
-    def write_temp_file(self, content: bytes, suffix: str = "", prefix: str = "slack_") -> str:
+    def write_temp_file(
+        self, content: bytes, suffix: str = "", prefix: str = "slack_",
+        scope: Optional[str] = None,
+    ) -> str:
         """
         Create a temp file and write content to it.
         
@@ -54,11 +121,18 @@ class TempFileManager:
             content: Binary content to write
             suffix: File suffix (e.g., ".jpg", ".png")
             prefix: File prefix
-            
+            scope: Owner of the file, usually the Slack thread_ts
+        
         Returns:
             Path to the created file
         """
-        filepath = self.create_temp_file(suffix=suffix, prefix=prefix)
+        in_memory = len(content) <= self.memory_max_bytes
+        filepath = self.create_temp_file(
+            suffix=suffix,
+            prefix=prefix,
+            scope=scope,
+            directory=self.memory_dir if in_memory else None,
+        )
         
         with open(filepath, 'wb') as f:
             f.write(content)
@@ -72,7 +146,7 @@ class TempFileManager:
         
         Args:
             filepath: Path to file to delete
-            
+        
         Returns:
             True if file was deleted, False otherwise
         """
@@ -81,15 +155,33 @@ class TempFileManager:
                 os.unlink(filepath)
                 logger.info(f"🗑️  Cleaned up temp file: {filepath}")
             
-            if filepath in self._temp_files:
-                self._temp_files.remove(filepath)
+            self._untrack(filepath)
             
             return True
-            
+        
         except Exception as e:
             logger.error(f"❌ Failed to cleanup {filepath}: {e}")
             return False
     
+    def _cleanup_paths(self, paths: List[str]) -> int:
+        return sum(1 for filepath in paths if self.cleanup_file(filepath))
+    
+    def cleanup_scope(self, scope: str) -> int:
+        """
+        Clean up the temp files of one scope (e.g. a Slack thread), leaving others alone.
+        
+        Returns:
+            Number of files successfully deleted
+        """
+        with self._lock:
+            paths = list(self._scopes.get(scope, ()))
+        if not paths:
+            return 0
+        
+        cleaned = self._cleanup_paths(paths)
+        logger.info(f"✅ Cleaned up {cleaned}/{len(paths)} temp files for scope {scope}")
+        return cleaned
+    
     def cleanup_all(self) -> int:
         """
         Clean up all tracked temporary files.
@@ -97,27 +189,81 @@ class TempFileManager:
         Returns:
             Number of files successfully deleted
         """
-        if not self._temp_files:
+        with self._lock:
+            paths = list(self._temp_files)
+        if not paths:
             return 0
         
-        logger.info(f"🧹 Cleaning up {len(self._temp_files)} temp file(s)...")
+        logger.info(f"🧹 Cleaning up {len(paths)} temp file(s)...")
+        
+        cleaned = self._cleanup_paths(paths)
+        
+        logger.info(f"✅ Cleaned up {cleaned}/{len(paths)} temp files")
+        return cleaned
+    
+    def reap(self, max_age: Optional[float] = None) -> int:
+        """
+        Delete tracked files older than `max_age` seconds (default: the manager's).
         
-        cleaned = 0
-        for filepath in list(self._temp_files):  # Copy list to avoid modification during iteration
-            if self.cleanup_file(filepath):
-                cleaned += 1
+        Returns:
+            Number of files successfully deleted
+        """
+        max_age = max_age if max_age is not None else self.max_age
+        if max_age is None:
+            return 0
+        cutoff = time.time() - max_age
+        with self._lock:
+            paths = [path for path, (_, created) in self._temp_files.items() if created < cutoff]
+        if not paths:
+            return 0
         
-        logger.info(f"✅ Cleaned up {cleaned}/{len(self._temp_files)} temp files")
+        cleaned = self._cleanup_paths(paths)
+        logger.info(f"🧹 Reaped {cleaned} temp file(s) older than {max_age:.0f}s")
         return cleaned
     
-    def get_tracked_files(self) -> List[str]:
-        """Get list of currently tracked temp files."""
-        return self._temp_files.copy()
+    def _ensure_reaper(self):
+        """Start the reaper thread on first use, if an age limit is set."""
+        if self.max_age is None or self._reaper is not None:
+            return
+        
+        def run():
+            while True:
+                time.sleep(self.reap_interval)
+                try:
+                    self.reap()
+                except Exception as e:
+                    logger.error(f"❌ Temp file reap failed: {e}")
+        
+        with self._lock:
+            if self._reaper is None:
+                self._reaper = threading.Thread(target=run, name="temp-reaper", daemon=True)
+                self._reaper.start()
+    
+    def get_tracked_files(self, scope: Optional[str] = None) -> List[str]:
+        """Get list of currently tracked temp files (optionally of one scope)."""
+        with self._lock:
+            if scope is not None:
+                return list(self._scopes.get(scope, ()))
+            return list(self._temp_files)
     
-    def get_tracked_count(self) -> int:
-        """Get count of currently tracked temp files."""
-        return len(self._temp_files)
+    def get_tracked_count(self, scope: Optional[str] = None) -> int:
+        """Get count of currently tracked temp files (optionally of one scope)."""
+        with self._lock:
+            if scope is not None:
+                return len(self._scopes.get(scope, ()))
+            return len(self._temp_files)
+
+
+def _from_settings() -> TempFileManager:
+    from src.config.settings import settings
+
+    return TempFileManager(
+        max_age=settings.temp_file_max_age or None,
+        reap_interval=settings.temp_reap_interval,
+        memory_dir=settings.temp_memory_dir or None,
+        memory_max_bytes=settings.temp_memory_max_kb * 1024,
+    )
 
 
 # Global instance for the Slack bot
-temp_file_manager = TempFileManager()
+temp_file_manager = _from_settings()
@@ -0,0 +1,129 @@
+"""
+Keyed worker pool.
+Runs jobs on a fixed set of threads while keeping jobs that share a key (e.g. a Slack
+thread_ts) strictly in submission order. The queue is bounded so callers can shed
+load instead of piling up work.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Tuple
+
+logger = logging.getLogger("WorkerPool")
+
+Job = Tuple[Callable[..., Any], tuple, dict, float]
+
+
+class KeyedWorkerPool:
+    """Thread pool with per-key FIFO ordering and a bounded backlog.
+
+    Different keys run in parallel; at most one job per key runs at a time, and the
+    next job for that key starts only after the previous one finished.
+    """
+
+    def __init__(self, workers: int = 8, max_queue: int = 100, name: str = "worker"):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.name = name
+        self._lock = threading.Lock()
+        # key -> jobs waiting for that key; a key is present while it has work queued or running
+        self._pending: Dict[Hashable, Deque[Job]] = {}
+        # keys ready to run, each at most once
+        self._ready: "queue.Queue[Hashable | None]" = queue.Queue()
+        self._queued = 0
+        self._active = 0
+        self._processed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._max_depth = 0
+        self._total_wait = 0.0
+        self._threads = [
+            threading.Thread(target=self._run, name=f"{name}-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> bool:
+        """Queue `fn(*args, **kwargs)` behind earlier jobs for `key`.
+
+        Returns False, without queueing, when the backlog is full.
+        """
+        with self._lock:
+            if self._queued >= self.max_queue:
+                self._rejected += 1
+                logger.warning(
+                    f"Rejected job for {key}: {self._queued} queued (limit {self.max_queue})"
+                )
+                return False
+
+            jobs = self._pending.get(key)
+            idle = jobs is None
+            if idle:
+                jobs = self._pending[key] = deque()
+            jobs.append((fn, args, kwargs, time.monotonic()))
+            self._queued += 1
+            self._max_depth = max(self._max_depth, self._queued)
+            depth, active = self._queued, self._active
+
+        # A key already in _pending is queued or running; its worker picks the job up
+        if idle:
+            self._ready.put(key)
+        logger.info(f"Queued job for {key} (depth {depth}, active {active}/{self.workers})")
+        return True
+
+    def _run(self):
+        while True:
+            key = self._ready.get()
+            if key is None:
+                return
+
+            with self._lock:
+                fn, args, kwargs, queued_at = self._pending[key].popleft()
+                self._queued -= 1
+                self._active += 1
+                self._total_wait += time.monotonic() - queued_at
+
+            failed = False
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                failed = True
+                logger.error(f"Job for {key} failed: {e}")
+
+            with self._lock:
+                self._active -= 1
+                self._processed += 1
+                self._failed += failed
+                more = bool(self._pending[key])
+                if not more:
+                    del self._pending[key]
+            if more:
+                self._ready.put(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and throughput counters."""
+        with self._lock:
+            started = self._processed + self._active
+            return {
+                "workers": self.workers,
+                "queued": self._queued,
+                "active": self._active,
+                "keys": len(self._pending),
+                "processed": self._processed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "max_depth": self._max_depth,
+                "avg_wait_ms": round(self._total_wait / started * 1000, 1) if started else 0.0,
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the workers once the jobs already handed to them are done."""
+        for _ in self._threads:
+            self._ready.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
@@ -0,0 +1,79 @@
+"""JsonlJournal: appends, replay, and compaction with offset relocation."""
+
+import threading
+
+import pytest
+
+pytest.importorskip("pydantic_settings")  # src.utils loads the settings
+
+from src.utils.journal import JsonlJournal
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = JsonlJournal(str(tmp_path / "state.jsonl"), compact_min_records=10)
+    yield journal
+    journal.close()
+
+
+def compact(journal, offsets, position):
+    """Run a compaction and return the relocate function it hands to `on_swap`."""
+    swapped = threading.Event()
+    relocations = []
+
+    def on_swap(relocate):
+        relocations.append(relocate)
+        swapped.set()
+
+    journal.compact_async(offsets, position, on_swap)
+    assert swapped.wait(5), "compaction never swapped the file"
+    while journal._compacting:  # `_compacting` is reset just after the swap
+        pass
+    return relocations[0]
+
+
+def test_append_read_and_replay(journal):
+    offsets = [journal.append({"i": i}) for i in range(5)]
+
+    assert journal.read(offsets[::-1]) == [{"i": i} for i in range(4, -1, -1)]
+    assert [(o, r) for o, r in journal.replay()] == list(zip(offsets, ({"i": i} for i in range(5))))
+    assert journal.position() > offsets[-1]
+
+
+def test_replay_skips_a_torn_line(journal):
+    journal.append({"i": 0})
+    with open(journal.path, "ab") as f:
+        f.write(b'{"i": 1, "torn')
+        f.write(b"\n")
+    journal.append({"i": 2})
+
+    assert [r for _, r in journal.replay()] == [{"i": 0}, {"i": 2}]
+    assert journal.record_count == 2
+
+
+def test_needs_compaction_once_dead_records_dominate(journal):
+    for i in range(12):
+        journal.append({"i": i})
+
+    assert not journal.needs_compaction(live_records=12)
+    assert journal.needs_compaction(live_records=3)
+
+
+def test_compaction_keeps_live_records_and_relocates_offsets(journal):
+    offsets = [journal.append({"i": i}) for i in range(20)]
+    live = offsets[5::5]  # records 5, 10, 15
+    position = journal.position()
+    # Written after the snapshot: must be carried over even though it isn't in `live`
+    late = journal.append({"i": "late"})
+
+    relocate = compact(journal, live, position)
+
+    assert [r for _, r in journal.replay()] == [{"i": 5}, {"i": 10}, {"i": 15}, {"i": "late"}]
+    assert journal.record_count == 4
+    assert relocate(offsets[0]) is None
+    assert journal.read([relocate(o) for o in live]) == [{"i": 5}, {"i": 10}, {"i": 15}]
+    assert journal.read([relocate(late)]) == [{"i": "late"}]
+
+    # Appends after the swap land in the new file
+    after = journal.append({"i": "after"})
+    assert journal.read([after]) == [{"i": "after"}]
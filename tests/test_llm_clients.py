@@ -0,0 +1,81 @@
+"""LLM client registry: one client per key, one HTTP pool per endpoint."""
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("httpx")
+pytest.importorskip("langchain_openai")
+
+from langchain_core.messages import HumanMessage
+from mock_llm_server import base_url, serve
+
+from src.config.llm import LLMClient
+from src.config.settings import settings
+
+
+@pytest.fixture
+def server():
+    server = serve(latency=0.0)
+    connections = []
+
+    class CountingHandler(server.RequestHandlerClass):
+        def setup(self):
+            connections.append(self.client_address)
+            super().setup()
+
+    server.RequestHandlerClass = CountingHandler
+    server.connections = connections
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server, monkeypatch):
+    monkeypatch.setattr(settings, "llm_base_url", base_url(server))
+    client = LLMClient()
+    yield client
+    client.close()
+
+
+def test_same_key_returns_same_client(client):
+    first = client.get_chat_model(purpose="content", provider="openai", model="gpt-4")
+    second = client.get_chat_model(purpose="content", provider="openai", model="gpt-4")
+
+    assert first is second
+    assert client.stats() == {"clients": 1, "http_pools": 1, "created": 1, "reused": 1}
+
+
+def test_different_keys_get_different_clients(client):
+    content = client.get_chat_model(purpose="content", provider="openai", model="gpt-4")
+    agent = client.get_chat_model(purpose="agent", provider="openai", model="gpt-4")
+    colder = client.get_chat_model(
+        purpose="content", provider="openai", model="gpt-4", temperature=0.2
+    )
+
+    assert len({id(content), id(agent), id(colder)}) == 3
+    assert client.stats()["created"] == 3
+
+
+def test_clients_share_one_http_pool_per_endpoint(client, server):
+    content = client.get_chat_model(purpose="content", provider="openai", model="gpt-4")
+    agent = client.get_chat_model(purpose="agent", provider="openai", model="gpt-4o-mini")
+    client.get_openai_client(purpose="image", provider="openai")
+
+    assert client.stats()["http_pools"] == 1
+    assert content.http_client is agent.http_client
+
+    for llm in (content, agent, content, agent):
+        assert "Harmony Garden" in llm.invoke([HumanMessage(content="write")]).content
+
+    # Four sequential calls through two chat models, one kept-alive connection
+    assert len(server.connections) == 1
+
+
+def test_close_drops_clients_and_pools(client):
+    first = client.get_chat_model(purpose="content", provider="openai", model="gpt-4")
+    client.close()
+
+    assert client.stats()["clients"] == 0
+    assert client.stats()["http_pools"] == 0
+    assert client.get_chat_model(purpose="content", provider="openai", model="gpt-4") is not first
@@ -0,0 +1,95 @@
+"""State backends: set-if-absent `add`, TTL expiry and persistence."""
+
+import time
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("crewai")  # src.agents builds the agents on import
+
+from src.agents.state_backends import FileStateBackend, SQLiteStateBackend
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "file":
+        backend = FileStateBackend(str(tmp_path / "state.jsonl"))
+    else:
+        backend = SQLiteStateBackend(str(tmp_path / "state.db"))
+    yield backend
+    backend.close()
+
+
+def test_add_only_sets_an_absent_key(backend):
+    assert backend.add("claims", "t1", {"user": "U1"})
+    assert not backend.add("claims", "t1", {"user": "U2"})
+
+    assert backend.get("claims", "t1") == {"user": "U1"}
+
+
+def test_add_is_scoped_by_namespace(backend):
+    assert backend.add("claims", "t1", 1)
+    assert backend.add("events", "t1", 2)
+
+
+def test_add_succeeds_after_delete(backend):
+    backend.add("claims", "t1", 1)
+    assert backend.delete("claims", "t1")
+
+    assert backend.add("claims", "t1", 2)
+    assert backend.get("claims", "t1") == 2
+
+
+def test_add_takes_over_an_expired_entry(backend):
+    assert backend.add("claims", "t1", 1, ttl=0.05)
+    assert not backend.add("claims", "t1", 2, ttl=0.05)
+    time.sleep(0.1)
+
+    assert backend.get("claims", "t1") is None
+    assert backend.add("claims", "t1", 3)
+    assert backend.get("claims", "t1") == 3
+
+
+def test_add_does_not_overwrite_an_entry_from_set(backend):
+    backend.set("pending", "t1", {"tool_name": "Create Article"})
+
+    assert not backend.add("pending", "t1", {"tool_name": "Delete Article"})
+    assert backend.get("pending", "t1") == {"tool_name": "Create Article"}
+
+
+def test_only_one_concurrent_add_wins(backend):
+    import threading
+
+    wins = []
+    start = threading.Barrier(8)
+
+    def claim(i):
+        start.wait()
+        if backend.add("claims", "t1", i):
+            wins.append(i)
+
+    threads = [threading.Thread(target=claim, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(wins) == 1
+    assert backend.get("claims", "t1") == wins[0]
+
+
+def test_file_backend_replays_entries_on_restart(tmp_path):
+    path = str(tmp_path / "state.jsonl")
+    backend = FileStateBackend(path)
+    backend.add("claims", "t1", 1)
+    backend.add("claims", "t2", 2)
+    backend.delete("claims", "t2")
+    backend.close()
+
+    reopened = FileStateBackend(path)
+    try:
+        assert reopened.get("claims", "t1") == 1
+        assert reopened.get("claims", "t2") is None
+        assert not reopened.add("claims", "t1", 3)
+    finally:
+        reopened.close()
@@ -0,0 +1,108 @@
+"""KeyedWorkerPool: per-key ordering, parallelism across keys and backpressure."""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("pydantic_settings")  # src.utils loads the settings
+
+from src.utils.worker_pool import KeyedWorkerPool
+
+
+@pytest.fixture
+def pool():
+    pool = KeyedWorkerPool(workers=4, max_queue=100, name="test")
+    yield pool
+    pool.shutdown()
+
+
+def wait_idle(pool, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        stats = pool.stats()
+        if not stats["queued"] and not stats["active"]:
+            return stats
+        time.sleep(0.01)
+    raise AssertionError(f"pool still busy: {pool.stats()}")
+
+
+def test_jobs_for_one_key_run_in_order_and_never_overlap(pool):
+    runs = {key: [] for key in ("a", "b", "c")}
+    running = {key: 0 for key in runs}
+    overlaps = []
+
+    def job(key, i):
+        running[key] += 1
+        if running[key] > 1:
+            overlaps.append(key)
+        time.sleep(0.002)
+        runs[key].append(i)
+        running[key] -= 1
+
+    for i in range(20):
+        for key in runs:
+            assert pool.submit(key, job, key, i)
+
+    stats = wait_idle(pool)
+    assert runs == {key: list(range(20)) for key in runs}
+    assert not overlaps
+    assert stats["processed"] == 60
+    assert stats["keys"] == 0
+
+
+def test_different_keys_run_in_parallel(pool):
+    barrier = threading.Barrier(3, timeout=2)
+    passed = []
+
+    def job():
+        barrier.wait()  # only returns if three keys run at once
+        passed.append(True)
+
+    for key in ("a", "b", "c"):
+        pool.submit(key, job)
+
+    wait_idle(pool)
+    assert passed == [True] * 3
+
+
+def test_failed_job_does_not_block_its_key(pool):
+    done = []
+
+    def fail():
+        raise RuntimeError("boom")
+
+    pool.submit("a", fail)
+    pool.submit("a", done.append, "next")
+
+    stats = wait_idle(pool)
+    assert done == ["next"]
+    assert stats["failed"] == 1
+
+
+def test_submit_rejects_when_backlog_is_full():
+    pool = KeyedWorkerPool(workers=1, max_queue=2, name="test")
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    try:
+        assert pool.submit("a", block)
+        assert started.wait(2)  # running jobs don't count against the backlog
+        assert pool.submit("a", lambda: None)
+        assert pool.submit("b", lambda: None)
+        assert not pool.submit("c", lambda: None)
+
+        stats = pool.stats()
+        assert stats["queued"] == 2
+        assert stats["rejected"] == 1
+
+        release.set()
+        wait_idle(pool)
+        assert pool.submit("c", lambda: None)
+    finally:
+        release.set()
+        pool.shutdown()